@@ -111,12 +111,17 @@ class AdapterManager:
     async def start_all(self) -> None:
         """Start all adapters, load initial signals, begin sync tasks.
 
-        Adapters that fail to connect will be scheduled for retry.
+        Adapters are started concurrently, so one slow adapter does not delay
+        the others. Adapters that fail to connect will be scheduled for retry.
         """
         store = self._get_store()
 
-        for name, state in self.states.items():
-            await self._start_adapter(name, state, store)
+        await asyncio.gather(
+            *(
+                self._start_adapter(name, state, store)
+                for name, state in self.states.items()
+            )
+        )
 
     async def _start_adapter(
         self,
@@ -210,7 +215,13 @@ class AdapterManager:
         self._retry_tasks[name] = asyncio.create_task(retry(), name=f"retry-{name}")
 
     async def stop_all(self) -> None:
-        """Stop all adapters and cleanup resources."""
+        """Stop all adapters and cleanup resources.
+
+        Adapters are closed concurrently, so shutdown takes as long as the
+        slowest adapter rather than the sum of all of them. A failing
+        close() is logged and does not prevent the other adapters from
+        being closed.
+        """
         # Cancel retry tasks
         for task in self._retry_tasks.values():
             task.cancel()
@@ -218,12 +229,22 @@ class AdapterManager:
                 await task
         self._retry_tasks.clear()
 
-        # Cancel sync tasks and close adapters
-        for name, state in self.states.items():
-            if state.sync_task is not None:
-                state.sync_task.cancel()
-                with contextlib.suppress(asyncio.CancelledError):
-                    await state.sync_task
+        # Cancel sync tasks and close adapters concurrently. Every close is
+        # awaited to completion before failures are reported.
+        results = await asyncio.gather(
+            *(self._stop_adapter(name, state) for name, state in self.states.items()),
+            return_exceptions=True,
+        )
+        for name, result in zip(self.states, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error(f"Adapter '{name}' failed to close: {result}")
+
+    async def _stop_adapter(self, name: str, state: AdapterState) -> None:
+        """Cancel a single adapter's sync task and close the adapter."""
+        if state.sync_task is not None:
+            state.sync_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await state.sync_task
 
-            await state.adapter.close()
-            logger.info(f"Adapter '{name}' closed")
+        await state.adapter.close()
+        logger.info(f"Adapter '{name}' closed")
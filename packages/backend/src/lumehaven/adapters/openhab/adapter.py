@@ -11,7 +11,8 @@ It handles the complexity of OpenHAB's data model, including:
 
 import json
 import logging
-from collections.abc import AsyncIterator, Iterator
+from collections.abc import AsyncIterator, Iterator, Mapping
+from functools import lru_cache
 from typing import Any, Literal
 
 import httpx
@@ -20,7 +21,7 @@ from ftfy import fix_encoding
 from lumehaven.adapters.openhab.units import (
     extract_unit_from_pattern,
     format_value,
-    get_default_units,
+    get_default_units_view,
 )
 from lumehaven.core.exceptions import SmartHomeConnectionError
 from lumehaven.core.signal import Signal
@@ -38,6 +39,26 @@ COMMA = "%2C"
 # Fields to request from OpenHAB REST API
 ITEM_FIELDS = ["name", "label", "state", "type", "stateDescription", "transformedState"]
 
+# Upper bound for memoized ftfy results (distinct event state strings)
+FIX_ENCODING_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=FIX_ENCODING_CACHE_SIZE)
+def _fix_encoding(text: str) -> str:
+    """Memoized wrapper around ftfy.fix_encoding.
+
+    fix_encoding is a pure function but comparatively expensive. SSE events
+    repeat the same state strings constantly (ON/OFF, recurring readings),
+    so caching turns the per-event cost into a dict lookup.
+
+    Args:
+        text: Raw state string from an OpenHAB event.
+
+    Returns:
+        The string with mojibake repaired.
+    """
+    return fix_encoding(text)
+
 
 class OpenHABAdapter:
     """Adapter for OpenHAB smart home system.
@@ -73,7 +94,7 @@ class OpenHABAdapter:
         self.base_url = base_url.rstrip("/")
         self.tag = tag
         self._client: httpx.AsyncClient | None = None
-        self._default_units: dict[str, str] = {}
+        self._default_units: Mapping[str, str] = {}
         self._item_metadata: dict[str, _ItemMetadata] = {}
 
     @property
@@ -134,7 +155,7 @@ class OpenHABAdapter:
         """Ensure default units are loaded."""
         if not self._default_units:
             system = await self._get_measurement_system()
-            self._default_units = get_default_units(system)
+            self._default_units = get_default_units_view(system)
 
     async def _get_measurement_system(self) -> Literal["SI", "US"]:
         """Get the measurement system configured in OpenHAB."""
@@ -411,7 +432,7 @@ class OpenHABAdapter:
         try:
             if metadata.event_state_contains_unit:
                 # State contains unit, need to extract and format
-                raw_state = fix_encoding(payload.get("state", ""))
+                raw_state = _fix_encoding(payload.get("state", ""))
                 value = format_value(
                     raw_state,
                     metadata.unit,
@@ -419,9 +440,9 @@ class OpenHABAdapter:
                     metadata.is_quantity_type,
                 )
             elif "displayState" in payload:
-                value = fix_encoding(payload["displayState"])
+                value = _fix_encoding(payload["displayState"])
             else:
-                value = fix_encoding(payload.get("state", ""))
+                value = _fix_encoding(payload.get("state", ""))
 
             return Signal(
                 id=self._prefixed_id(item_name),
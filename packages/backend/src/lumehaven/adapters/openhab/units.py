@@ -7,10 +7,13 @@ Ported from PoC: old/backend/home-observer/openhab.py
 Reference: old/backend/home-observer/units_of_measurement.json
 """
 
-import re
+import sys
+from collections.abc import Callable, Mapping
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Literal
 
-from lumehaven.core.signal import is_undefined
+from lumehaven.core.signal import UNDEFINED_STATES
 
 # Default units by QuantityType for SI and US measurement systems
 # Reference: https://www.openhab.org/docs/concepts/units-of-measurement.html
@@ -67,6 +70,9 @@ DEFAULT_UNITS: dict[str, dict[str, str]] = {
     },
 }
 
+# SI defaults with US overrides applied, merged once at import time
+_US_DEFAULT_UNITS: dict[str, str] = DEFAULT_UNITS["SI"] | DEFAULT_UNITS["US"]
+
 
 def get_default_units(system: Literal["SI", "US"] = "SI") -> dict[str, str]:
     """Get default units for a measurement system.
@@ -80,19 +86,48 @@ def get_default_units(system: Literal["SI", "US"] = "SI") -> dict[str, str]:
         Dictionary mapping QuantityType names to unit symbols.
     """
     if system == "US":
-        # Start with SI, overlay US-specific units
-        return DEFAULT_UNITS["SI"] | DEFAULT_UNITS["US"]
+        return _US_DEFAULT_UNITS.copy()
     return DEFAULT_UNITS["SI"].copy()
 
 
-# Pattern to extract format specifier and unit from OpenHAB state patterns
-# Examples: "%.1f °C" -> ("%f", "°C"), "%d %%" -> ("%d", "%"), "%s" -> ("%s", "")
-PATTERN_REGEX = re.compile(r"(%\S*[fds])\s*(.*)")
+# Read-only views per measurement system, built once at import time
+_DEFAULT_UNIT_VIEWS: dict[str, Mapping[str, str]] = {
+    "SI": MappingProxyType(DEFAULT_UNITS["SI"]),
+    "US": MappingProxyType(_US_DEFAULT_UNITS),
+}
+
+
+def get_default_units_view(system: Literal["SI", "US"] = "SI") -> Mapping[str, str]:
+    """Get a shared, read-only view of the default units for a system.
+
+    Same content as get_default_units(), but without copying. Use this
+    for lookups; use get_default_units() when the caller needs to mutate.
+
+    Args:
+        system: Measurement system ("SI" or "US").
+
+    Returns:
+        Read-only mapping of QuantityType names to unit symbols.
+    """
+    return _DEFAULT_UNIT_VIEWS[system]
+
+
+# Upper bound for cached pattern/format parses. Patterns repeat heavily
+# across items (e.g. every temperature sensor uses "%.1f °C").
+PARSE_CACHE_SIZE = 512
+
+# Upper bound for memoized format_value() results, sized for a few
+# thousand items each cycling through a handful of recent states.
+FORMAT_CACHE_SIZE = 4096
 
 
 def extract_unit_from_pattern(pattern: str) -> tuple[str, str]:
     """Extract unit and format from an OpenHAB state description pattern.
 
+    The pattern grammar is ``%<non-space chars ending in f|d|s>``, then
+    optional whitespace, then the unit up to the end of the line. It is
+    recognized with plain string scanning rather than a regex.
+
     Args:
         pattern: State pattern from OpenHAB (e.g., "%.1f °C", "%d %%").
 
@@ -109,13 +144,89 @@ def extract_unit_from_pattern(pattern: str) -> tuple[str, str]:
         >>> extract_unit_from_pattern("%s")
         ('', '%s')
     """
-    match = PATTERN_REGEX.match(pattern)
-    if match is None:
+    return _parse_pattern(pattern)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_pattern(pattern: str) -> tuple[str, str]:
+    """Parse a state pattern into (unit, format_string), memoized.
+
+    See extract_unit_from_pattern() for the contract. The parts are
+    interned, so the format strings and units later used as cache and
+    dispatch keys compare by identity.
+    """
+    if not pattern.startswith("%"):
         return pattern, "%s"
 
-    format_str = match.group(1)
-    unit = match.group(2).replace("%%", "%")
-    return unit, format_str
+    # The specifier is the leading whitespace-free token, cut after its
+    # last conversion character (greedy, like the regex %\S*[fds]).
+    head = pattern.split(None, 1)[0]
+    end = max(head.rfind("f"), head.rfind("d"), head.rfind("s"))
+    if end < 0:
+        return pattern, "%s"
+
+    format_str = sys.intern(pattern[: end + 1])
+    unit = pattern[end + 1 :].lstrip().partition("\n")[0]
+    return sys.intern(unit.replace("%%", "%")), format_str
+
+
+# Direct formatters for the specifiers nearly all OpenHAB patterns use.
+# A single dict lookup dispatches these; others go through _build_formatter().
+_FORMATTERS: dict[str, Callable[[float], str]] = {
+    "%d": lambda number: str(round(number)),
+    "%.0f": lambda number: format(number, ".0f"),
+    "%.1f": lambda number: format(number, ".1f"),
+    "%.2f": lambda number: format(number, ".2f"),
+    "%.3f": lambda number: format(number, ".3f"),
+}
+
+
+def _parse_format(format_str: str) -> tuple[str, int]:
+    """Classify a format string as (format_type, precision).
+
+    format_type is "d" or "f" for numeric specifiers (by conversion
+    character) and "s" for everything else. precision only applies to
+    "f": it is N for the plain "%.Nf" form, which can be rendered without
+    printf-style parsing, and -1 for any other "f" specifier ("use the %
+    operator"). "d" and "s" always report -1, since their formatting
+    does not depend on a precision.
+
+    Args:
+        format_str: Format string from extract_unit_from_pattern().
+
+    Returns:
+        Tuple of (format_type, precision).
+    """
+    if format_str.endswith("d"):
+        return "d", -1
+    if format_str.endswith("f"):
+        digits = format_str[2:-1]
+        if format_str.startswith("%.") and digits.isascii() and digits.isdigit():
+            return "f", int(digits)
+        return "f", -1
+    return "s", -1
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _build_formatter(format_str: str) -> Callable[[float], str] | None:
+    """Build the numeric formatter for a specifier outside _FORMATTERS.
+
+    Args:
+        format_str: Format string from extract_unit_from_pattern().
+
+    Returns:
+        Callable rendering a float, or None for non-numeric formats
+        (e.g. "%s"), where the value is displayed without parsing.
+    """
+    format_type, precision = _parse_format(format_str)
+    if format_type == "d":
+        return lambda number: format_str % round(number)
+    if format_type == "f":
+        if precision >= 0:
+            spec = format_str[1:]
+            return lambda number: format(number, spec)
+        return lambda number: format_str % number
+    return None
 
 
 def format_value(
@@ -148,29 +259,82 @@ def format_value(
         >>> format_value("42", "", "%d", is_quantity_type=False)
         '42'
     """
-    # Preserve undefined states
-    if is_undefined(state):
-        return state
+    return _format_value(state, unit, format_str, is_quantity_type)
+
+
+@lru_cache(maxsize=FORMAT_CACHE_SIZE)
+def _format_value(
+    state: str,
+    unit: str,
+    format_str: str,
+    is_quantity_type: bool,
+) -> str:
+    """Memoized implementation of format_value().
+
+    The result depends only on the arguments, and most updates repeat a
+    recent (state, unit, format) combination, so they become a cache hit.
+    Misses run the formatter specialized for (unit, format_str,
+    is_quantity_type) by _compile_format().
+    """
+    return _compile_format(unit, format_str, is_quantity_type)(state)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _compile_format(
+    unit: str,
+    format_str: str,
+    is_quantity_type: bool,
+) -> Callable[[str], str]:
+    """Build a state formatter specialized for one item configuration.
 
+    Everything that depends only on the item's unit and pattern (which
+    suffix to strip, which number formatter to use, whether a number is
+    expected at all) is decided here once, so the returned closure only
+    does the per-state work.
+
+    Args:
+        unit: Expected unit suffix to strip.
+        format_str: Format pattern (e.g., "%d", "%.1f", "%s").
+        is_quantity_type: Whether the item is a QuantityType.
+
+    Returns:
+        Callable taking a raw state and returning the display value.
+    """
     # No formatting needed
     if not unit and not format_str:
-        return state
-
-    # Strip unit from QuantityType states
-    # e.g., "21.5 °C" -> "21.5"
-    if is_quantity_type and unit and state.endswith(unit):
-        value = state[: -len(unit)].rstrip()
-    else:
-        value = state.rstrip()
-
-    # Apply numeric formatting
-    try:
-        if format_str.endswith("d"):
-            return format_str % round(float(value))
-        elif format_str.endswith("f"):
-            return format_str % float(value)
-    except ValueError, TypeError:
-        # Can't convert to number, return as-is
-        pass
-
-    return value
+        return _passthrough
+
+    # Strip unit from QuantityType states, e.g. "21.5 °C" -> "21.5".
+    # removesuffix("") is a no-op, so non-QuantityTypes strip nothing.
+    suffix = unit if is_quantity_type else ""
+
+    # Only numeric formats need float(); "%s" and unit-only patterns skip
+    # both the parse and the exception handling.
+    formatter = _FORMATTERS.get(format_str) or _build_formatter(format_str)
+    if formatter is None:
+
+        def format_text(state: str) -> str:
+            if state in UNDEFINED_STATES:
+                return state
+            return state.removesuffix(suffix).rstrip()
+
+        return format_text
+
+    def format_number(state: str) -> str:
+        # Preserve undefined states. Checked inline rather than via the
+        # deprecated is_undefined(), which emits a warning on every call.
+        if state in UNDEFINED_STATES:
+            return state
+        value = state.removesuffix(suffix).rstrip()
+        try:
+            return formatter(float(value))
+        except ValueError, TypeError, OverflowError:
+            # Can't convert to number (or round "inf" for %d), return as-is
+            return value
+
+    return format_number
+
+
+def _passthrough(state: str) -> str:
+    """Formatter for items without unit or pattern: state is shown as-is."""
+    return state
@@ -4,9 +4,10 @@ Defines the REST API and SSE endpoints for the lumehaven backend.
 """
 
 import logging
+import uuid
 from typing import Annotated, Literal, Self
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from pydantic import BaseModel, model_validator
 
 from lumehaven.core.signal import Signal, SignalType, SignalValue
@@ -16,6 +17,9 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Distinguishes ETags across process restarts, where the store version restarts
+_ETAG_EPOCH = uuid.uuid4().hex[:12]
+
 
 # ---------------------------------------------------------------------------
 # Type aliases for dependency injection
@@ -43,8 +47,12 @@ class SignalResponse(BaseModel):
 
     @classmethod
     def from_signal(cls, signal: Signal) -> Self:
-        """Create from domain Signal."""
-        return cls(
+        """Create from domain Signal.
+
+        Signal is a typed, immutable domain object, so its fields are used
+        as-is via model_construct() instead of being validated again.
+        """
+        return cls.model_construct(
             id=signal.id,
             value=signal.value,
             display_value=signal.display_value,
@@ -64,10 +72,10 @@ class SignalsResponse(BaseModel):
     @model_validator(mode="after")
     def validate_count_matches_signals(self) -> Self:
         """Ensure count matches the actual number of signals."""
-        if self.count != len(self.signals):
+        signal_count = len(self.signals)
+        if self.count != signal_count:
             raise ValueError(
-                f"count ({self.count}) does not match "
-                f"len(signals) ({len(self.signals)})"
+                f"count ({self.count}) does not match len(signals) ({signal_count})"
             )
         return self
 
@@ -174,18 +182,54 @@ async def metrics(
     )
 
 
-@router.get("/api/signals", response_model=SignalsResponse, tags=["signals"])
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+@router.get(
+    "/api/signals",
+    response_model=SignalsResponse,
+    tags=["signals"],
+    responses={304: {"description": "Signals unchanged since the given ETag"}},
+)
 async def list_signals(
+    request: Request,
+    response: Response,
     store: Annotated[SignalStore, Depends(get_signal_store)],
-) -> SignalsResponse:
+) -> SignalsResponse | Response:
     """Get all signals.
 
     Returns all currently known signals with their latest values.
+
+    The response carries a weak ETag derived from the store version. A request
+    whose If-None-Match header matches it gets an empty 304 response instead,
+    which skips building and serializing the signal list.
     """
+    # Read the version before the signals: if a write lands in between, the
+    # ETag is older than the content and the next request refetches.
+    etag = f'W/"{_ETAG_EPOCH}-{store.version}"'
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None and _etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag},
+        )
+
     signals = await store.get_all()
-    return SignalsResponse(
-        signals=[SignalResponse.from_signal(s) for s in signals.values()],
-        count=len(signals),
+    response.headers["ETag"] = etag
+    # count is derived from the list itself, so the count invariant holds by
+    # construction and validating the list again is skipped
+    signal_responses = [SignalResponse.from_signal(s) for s in signals.values()]
+    return SignalsResponse.model_construct(
+        signals=signal_responses,
+        count=len(signal_responses),
     )
 
 
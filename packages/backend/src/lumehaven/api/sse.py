@@ -7,12 +7,15 @@ pub/sub mechanism with HTTP SSE.
 
 import json
 import logging
+from collections import OrderedDict
 from collections.abc import AsyncGenerator
 from typing import Annotated
 
 from fastapi import APIRouter, Depends
+from sse_starlette.event import ServerSentEvent
 from sse_starlette.sse import EventSourceResponse
 
+from lumehaven.core.signal import Signal
 from lumehaven.state.store import SignalStore, get_signal_store
 
 logger = logging.getLogger(__name__)
@@ -22,10 +25,38 @@ router = APIRouter()
 # Heartbeat interval in seconds (keeps connection alive through proxies)
 HEARTBEAT_INTERVAL = 30
 
+# Recently encoded event frames, keyed by Signal identity. SignalStore.publish()
+# hands the same Signal instance to every subscriber, so one serialization and
+# SSE framing serves all connected clients. Identity rather than equality is
+# used because equal signals can still serialize differently
+# (value 1 == True == 1.0). Each entry holds the signal itself, so its id()
+# cannot be reused while cached.
+FRAME_CACHE_SIZE = 256
+_frame_cache: OrderedDict[int, tuple[Signal, bytes]] = OrderedDict()
+
+
+def _encode_signal_event(signal: Signal) -> bytes:
+    """Return the wire-format 'signal' event for a signal, encoding it once.
+
+    EventSourceResponse passes bytes through unchanged, so subscribers skip
+    per-client framing and UTF-8 encoding.
+    """
+    entry = _frame_cache.get(id(signal))
+    if entry is not None and entry[0] is signal:
+        return entry[1]
+    frame = ServerSentEvent(
+        data=json.dumps(signal.to_dict(), ensure_ascii=False),
+        event="signal",
+    ).encode()
+    _frame_cache[id(signal)] = (signal, frame)
+    if len(_frame_cache) > FRAME_CACHE_SIZE:
+        _frame_cache.popitem(last=False)
+    return frame
+
 
 async def signal_event_generator(
     store: SignalStore,
-) -> AsyncGenerator[dict[str, str]]:
+) -> AsyncGenerator[bytes]:
     """Generate SSE events from a signal store subscription.
 
     Note: The subscription is registered when this generator starts iterating
@@ -38,13 +69,10 @@ async def signal_event_generator(
         store: SignalStore to subscribe to for updates.
 
     Yields:
-        Dict with 'event' and 'data' keys for SSE protocol.
+        Encoded SSE 'signal' events whose data is the JSON-encoded Signal.
     """
     async for signal in store.subscribe():
-        yield {
-            "event": "signal",
-            "data": json.dumps(signal.to_dict(), ensure_ascii=False),
-        }
+        yield _encode_signal_event(signal)
 
 
 @router.get("/api/events/signals", tags=["signals"])
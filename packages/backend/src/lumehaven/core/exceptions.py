@@ -35,10 +35,8 @@ class SmartHomeConnectionError(LumehavenError):
         self.system = system
         self.url = url
         self.cause = cause
-        message = f"Failed to connect to {system} at {url}"
-        if cause:
-            message += f": {cause}"
-        super().__init__(message)
+        suffix = f": {cause}" if cause else ""
+        super().__init__(f"Failed to connect to {system} at {url}{suffix}")
 
 
 class AdapterError(LumehavenError):
@@ -19,6 +19,7 @@ from __future__ import annotations
 import warnings
 from dataclasses import dataclass
 from enum import StrEnum
+from operator import itemgetter
 from typing import Any
 
 
@@ -47,6 +48,10 @@ class SignalType(StrEnum):
 # Type alias for the enriched value union (ADR-010).
 SignalValue = str | int | float | bool | None
 
+# Fetches the fields Signal.from_dict() requires in one call; raises KeyError
+# naming the first missing field.
+_required_fields = itemgetter("id", "value")
+
 
 @dataclass(frozen=True, slots=True)
 class Signal:
@@ -138,15 +143,12 @@ class Signal:
             ValueError: If ``signal_type`` is present but not a valid
                 ``SignalType`` member.
         """
-        # Determine value: enriched dicts may have explicit None
-        if "value" in data:
-            value = data["value"]
-        else:
-            raise KeyError("value")
+        # Enriched dicts may have an explicit None value
+        signal_id, value = _required_fields(data)
 
         # Normalize legacy sentinels (ADR-005 → ADR-010 transition).
         # Convert UNDEF/NULL strings to None with available=False.
-        if isinstance(value, str) and value in (UNDEFINED_VALUE, NULL_VALUE):
+        if isinstance(value, str) and value in UNDEFINED_STATES:
             value = None
 
         # Parse signal_type from string if present
@@ -161,7 +163,7 @@ class Signal:
         available = data.get("available", value is not None)
 
         return cls(
-            id=data["id"],
+            id=signal_id,
             value=value,
             display_value=data.get(
                 "display_value", str(value) if value is not None else ""
@@ -178,6 +180,7 @@ class Signal:
 # Adapters use them to set ``available=False`` and ``value=None``.
 UNDEFINED_VALUE = "UNDEF"
 NULL_VALUE = "NULL"
+UNDEFINED_STATES: frozenset[str] = frozenset({UNDEFINED_VALUE, NULL_VALUE})
 
 
 def is_undefined(value: str) -> bool:
@@ -202,4 +205,4 @@ def is_undefined(value: str) -> bool:
         DeprecationWarning,
         stacklevel=2,
     )
-    return value in (UNDEFINED_VALUE, NULL_VALUE)
+    return value in UNDEFINED_STATES
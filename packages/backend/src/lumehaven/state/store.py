@@ -54,6 +54,11 @@ class SignalStoreProtocol(Protocol):
         """Publish a signal update to subscribers."""
         ...
 
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever stored signals are written."""
+        ...
+
 
 class SignalStore:
     """In-memory implementation of signal storage.
@@ -68,11 +73,13 @@ class SignalStore:
         _signals: Dictionary of signal ID to Signal.
         _lock: Asyncio lock for thread-safe access.
         _subscribers: Set of queues for pub/sub.
+        _version: Counter incremented on every write, for change detection.
     """
 
     def __init__(self) -> None:
         """Initialize empty signal store."""
         self._signals: dict[str, Signal] = {}
+        self._version = 0
         self._lock = asyncio.Lock()
         self._subscribers: set[asyncio.Queue[Signal]] = set()
         # Track drops per subscriber: queue -> (drop_count, last_log_time)
@@ -107,6 +114,7 @@ class SignalStore:
         """
         async with self._lock:
             self._signals[signal.id] = signal
+            self._version += 1
 
     async def set_many(self, signals: dict[str, Signal]) -> None:
         """Store or update multiple signals atomically.
@@ -116,6 +124,7 @@ class SignalStore:
         """
         async with self._lock:
             self._signals.update(signals)
+            self._version += 1
         logger.debug(f"Stored {len(signals)} signals")
 
     async def subscribe(self) -> AsyncGenerator[Signal]:
@@ -219,6 +228,15 @@ class SignalStore:
             # Suppress log, just increment counter
             self._drop_stats[queue] = (drop_count, last_log_time)
 
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever stored signals are written.
+
+        Lets callers such as the REST API detect whether the store changed
+        since a previous read without comparing its contents.
+        """
+        return self._version
+
     def subscriber_count(self) -> int:
         """Get the number of active subscribers.
 
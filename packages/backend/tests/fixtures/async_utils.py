@@ -9,6 +9,8 @@ import asyncio
 import time
 from collections.abc import Callable
 
+_INITIAL_POLL_INTERVAL = 0.001  # seconds
+
 
 async def wait_for_condition(
     condition: Callable[[], bool],
@@ -19,6 +21,9 @@ async def wait_for_condition(
 ) -> None:
     """Poll until condition() returns True, or raise TimeoutError.
 
+    Polling starts at 1ms and doubles up to `interval`, so conditions that
+    become true almost immediately are detected without a full interval wait.
+
     This is more robust than fixed sleeps for verifying async state changes.
     Use this when you need to wait for a side effect to complete (e.g.,
     subscriber cleanup, queue drain) rather than coordinating concurrent
@@ -29,8 +34,8 @@ async def wait_for_condition(
             checking some observable state,
             e.g., `lambda: store.subscriber_count() == 0`.
         timeout: Maximum seconds to wait before raising TimeoutError.
-        interval: Seconds between condition checks. Default 5ms balances
-            responsiveness with CPU overhead.
+        interval: Maximum seconds between condition checks. Default 5ms
+            balances responsiveness with CPU overhead.
         description: Human-readable description for the timeout error message.
 
     Raises:
@@ -46,8 +51,10 @@ async def wait_for_condition(
         ```
     """
     start = time.monotonic()
+    delay = min(_INITIAL_POLL_INTERVAL, interval)
     while time.monotonic() - start < timeout:
         if condition():
             return
-        await asyncio.sleep(interval)
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, interval)
     raise TimeoutError(f"Timed out waiting for {description}")
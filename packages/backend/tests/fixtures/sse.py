@@ -0,0 +1,106 @@
+"""SSE testing utilities.
+
+Helpers for driving signal_event_generator against a SignalStore without
+repeating the subscribe → publish → collect → cancel choreography per test.
+"""
+
+import asyncio
+import contextlib
+from collections.abc import Iterable
+
+import pytest
+
+from lumehaven.api.sse import signal_event_generator
+from lumehaven.core.signal import Signal
+from lumehaven.state.store import SignalStore
+from tests.fixtures.async_utils import wait_for_condition
+
+
+def parse_sse_frame(frame: bytes) -> dict[str, str]:
+    """Parse one encoded SSE frame back into its fields.
+
+    Args:
+        frame: Wire-format event as yielded by signal_event_generator.
+
+    Returns:
+        Mapping of field name (e.g. 'event', 'data') to value. Multi-line
+        data fields are joined with newlines.
+    """
+    fields: dict[str, str] = {}
+    for line in frame.decode("utf-8").splitlines():
+        if not line:
+            continue
+        name, _, value = line.partition(": ")
+        if name in fields:
+            fields[name] += "\n" + value
+        else:
+            fields[name] = value
+    return fields
+
+
+async def collect_sse_events(
+    store: SignalStore,
+    signals: Iterable[Signal],
+    count: int,
+    *,
+    timeout: float = 1.0,
+) -> list[dict[str, str]]:
+    """Publish signals to a store and collect the SSE events they produce.
+
+    Starts one signal_event_generator, waits until its subscription is
+    registered, publishes the signals, and returns the first `count` events.
+    The generator is closed afterwards, so the subscriber is unregistered.
+    If an event does not arrive within timeout, the test fails with a
+    message naming the missing event and how many were received.
+
+    Args:
+        store: SignalStore the generator subscribes to.
+        signals: Signals to publish once the subscriber is registered.
+        count: Number of events to collect.
+        timeout: Maximum seconds to wait for each event.
+
+    Returns:
+        The collected events parsed with parse_sse_frame, in the order
+        they were yielded.
+
+    Raises:
+        TimeoutError: If the subscription is not registered within timeout.
+
+    Example:
+        ```python
+        events = await collect_sse_events(store, [signal], count=1)
+        assert events[0]["event"] == "signal"
+        ```
+    """
+    initial_count = store.subscriber_count()
+    generator = signal_event_generator(store)
+    # The subscription is registered once the generator starts iterating
+    pending = asyncio.ensure_future(anext(generator))
+    try:
+        await wait_for_condition(
+            lambda: store.subscriber_count() > initial_count,
+            timeout=timeout,
+            description="subscriber registered",
+        )
+        for signal in signals:
+            await store.publish(signal)
+
+        events = []
+        while len(events) < count:
+            try:
+                frame = await asyncio.wait_for(pending, timeout=timeout)
+            except TimeoutError:
+                pytest.fail(
+                    f"Timed out waiting for SSE event {len(events) + 1} of {count}; "
+                    f"received {len(events)} event(s), "
+                    f"waited {timeout} seconds for the next."
+                )
+            events.append(parse_sse_frame(frame))
+            if len(events) < count:
+                pending = asyncio.ensure_future(anext(generator))
+        return events
+    finally:
+        pending.cancel()
+        with contextlib.suppress(asyncio.CancelledError, StopAsyncIteration):
+            await pending
+        await generator.aclose()
@@ -176,12 +176,26 @@ EXISTING_SSE_EVENTS = {"ItemStateEvent", "ItemStateChangedEvent", "ItemCommandEv
 # Parsers
 # =============================================================================
 
+# Unit after an optional printf specifier in a stateDescription pattern,
+# e.g. "%.1f °C" -> "°C". The specifier is matched possessively, so its
+# conversion character is never taken as the unit ("%.1f" has no unit).
+UNIT_PATTERN = re.compile(
+    r"(?:%[-+ #0,]*\d*(?:\.\d+)?[a-zA-Z])?+\s*([°%€$£¥a-zA-Z/³²]+)"
+)
+SSE_BLOCK_SEPARATOR = re.compile(r"\n\n+")
+SSE_DATA_PATTERN = re.compile(r"^data:\s*(.+)$", re.MULTILINE)
+
 
 def parse_items_snapshot(path: Path, report: AnalysisReport) -> None:
     """Parse items snapshot JSON and extract type/pattern information."""
     with open(path) as f:
         items = json.load(f)
 
+    parse_items(items, report)
+
+
+def parse_items(items: list[dict[str, Any]], report: AnalysisReport) -> None:
+    """Extract type/pattern information from already-decoded items."""
     report.total_items = len(items)
 
     for item in items:
@@ -210,7 +224,7 @@ def parse_items_snapshot(path: Path, report: AnalysisReport) -> None:
                 if pattern not in info.pattern_examples:
                     info.pattern_examples.append(pattern)
                 # Extract unit from pattern
-                unit_match = re.search(r"(?:%[^%]*)?([°%€$£¥a-zA-Z/³²]+)$", pattern)
+                unit_match = UNIT_PATTERN.fullmatch(pattern)
                 if unit_match:
                     unit = unit_match.group(1)
                     if unit not in info.unit_examples:
@@ -251,9 +265,14 @@ def parse_sse_events(path: Path, report: AnalysisReport) -> None:
     with open(path) as f:
         content = f.read()
 
+    parse_sse_content(content, report)
+
+
+def parse_sse_content(content: str, report: AnalysisReport) -> None:
+    """Extract event type/payload information from raw SSE log text."""
     # SSE format: "event: EventType\ndata: {json}\n\n"
     # Or just "data: {json}\n\n"
-    event_blocks = re.split(r"\n\n+", content)
+    event_blocks = SSE_BLOCK_SEPARATOR.split(content)
 
     for block in event_blocks:
         block = block.strip()
@@ -261,7 +280,7 @@ def parse_sse_events(path: Path, report: AnalysisReport) -> None:
             continue
 
         # Extract data
-        data_match = re.search(r"^data:\s*(.+)$", block, re.MULTILINE)
+        data_match = SSE_DATA_PATTERN.search(block)
         if not data_match:
             continue
 
@@ -12,8 +12,9 @@ Key Fixtures:
 from __future__ import annotations
 
 import asyncio
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Mapping
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 import pytest
@@ -57,7 +58,7 @@ class MockAdapter:
     # Behavior configuration
     should_fail_connect: bool = False
     connect_error_message: str = "Connection refused"
-    signals_to_return: dict[str, Signal] = field(default_factory=dict)
+    signals_to_return: Mapping[str, Signal] = field(default_factory=dict)
 
     # Event stream configuration
     events_to_yield: list[Signal] = field(default_factory=list)
@@ -70,6 +71,10 @@ class MockAdapter:
     subscribe_events_call_count: int = 0
     close_call_count: int = 0
 
+    # Events for awaiting adapter activity without polling
+    get_signals_called: asyncio.Event = field(default_factory=asyncio.Event)
+    stream_ended: asyncio.Event = field(default_factory=asyncio.Event)
+
     # Internal state
     _connected: bool = False
     _event_queue: asyncio.Queue[Signal | None] = field(default_factory=asyncio.Queue)
@@ -97,12 +102,13 @@ class MockAdapter:
             ConnectionError: If should_fail_connect is True.
         """
         self.get_signals_call_count += 1
+        self.get_signals_called.set()
 
         if self.should_fail_connect:
             raise ConnectionError(self.connect_error_message)
 
         self._connected = True
-        return self.signals_to_return.copy()
+        return dict(self.signals_to_return)
 
     async def get_signal(self, signal_id: str) -> Signal | None:
         """Get a specific signal by ID."""
@@ -112,6 +118,7 @@ class MockAdapter:
         """Subscribe to real-time signal updates.
 
         Yields events from events_to_yield list, then from _event_queue.
+        Sets stream_ended once the stream stops yielding.
 
         Raises:
             ConnectionError: If should_fail_subscribe is True.
@@ -121,34 +128,37 @@ class MockAdapter:
         if self.should_fail_subscribe:
             raise ConnectionError(self.subscribe_error_message)
 
-        # Yield pre-configured events first
-        events_yielded = 0
-        for signal in self.events_to_yield:
-            if (
-                self.event_stream_closes_after is not None
-                and events_yielded >= self.event_stream_closes_after
-            ):
-                return  # Simulate stream close
-            yield signal
-            events_yielded += 1
-
-        # Then yield from queue (for dynamic event injection during tests)
-        while True:
-            if (
-                self.event_stream_closes_after is not None
-                and events_yielded >= self.event_stream_closes_after
-            ):
-                return  # Simulate stream close
-
-            try:
-                event = await asyncio.wait_for(self._event_queue.get(), timeout=0.1)
-                if event is None:
-                    return  # Graceful shutdown signal
-                yield event
+        try:
+            # Yield pre-configured events first
+            events_yielded = 0
+            for signal in self.events_to_yield:
+                if (
+                    self.event_stream_closes_after is not None
+                    and events_yielded >= self.event_stream_closes_after
+                ):
+                    return  # Simulate stream close
+                yield signal
                 events_yielded += 1
-            except TimeoutError:
-                # No event available, keep polling
-                continue
+
+            # Then yield from queue (for dynamic event injection during tests)
+            while True:
+                if (
+                    self.event_stream_closes_after is not None
+                    and events_yielded >= self.event_stream_closes_after
+                ):
+                    return  # Simulate stream close
+
+                try:
+                    event = await asyncio.wait_for(self._event_queue.get(), timeout=0.1)
+                    if event is None:
+                        return  # Graceful shutdown signal
+                    yield event
+                    events_yielded += 1
+                except TimeoutError:
+                    # No event available, keep polling
+                    continue
+        finally:
+            self.stream_ended.set()
 
     def is_connected(self) -> bool:
         """Check if adapter is currently connected."""
@@ -179,6 +189,7 @@ class MockAdapter:
         self.get_signals_call_count = 0
         self.subscribe_events_call_count = 0
         self.close_call_count = 0
+        self.get_signals_called.clear()
 
 
 # =============================================================================
@@ -226,14 +237,19 @@ def mock_adapter_factory() -> Callable[..., MockAdapter]:
     return _create
 
 
-@pytest.fixture
-def sample_signals() -> dict[str, Signal]:
-    """Sample signals for adapter tests."""
-    return {
-        "mock:temp_1": Signal(
-            id="mock:temp_1", value="21.5", unit="°C", label="Temperature"
-        ),
-        "mock:switch_1": Signal(
-            id="mock:switch_1", value="ON", unit="", label="Light Switch"
-        ),
-    }
+@pytest.fixture(scope="module")
+def sample_signals() -> Mapping[str, Signal]:
+    """Sample signals for adapter tests.
+
+    Shared per module as a read-only view; Signal instances are immutable.
+    """
+    return MappingProxyType(
+        {
+            "mock:temp_1": Signal(
+                id="mock:temp_1", value="21.5", unit="°C", label="Temperature"
+            ),
+            "mock:switch_1": Signal(
+                id="mock:switch_1", value="ON", unit="", label="Light Switch"
+            ),
+        }
+    )
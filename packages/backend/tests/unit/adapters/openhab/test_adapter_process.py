@@ -25,7 +25,7 @@ from typing import TYPE_CHECKING
 import httpx
 import pytest
 
-from lumehaven.adapters.openhab.adapter import OpenHABAdapter
+from lumehaven.adapters.openhab.adapter import OpenHABAdapter, _fix_encoding
 from tests.fixtures.openhab_responses import (
     DIMENSIONLESS_ITEM,
     TEMPERATURE_ITEM,
@@ -300,3 +300,22 @@ class TestProcessEventException:
         # Should get the valid signal, None was skipped
         assert len(signals) == 1
         assert signals[0].value == "21.0"
+
+
+class TestFixEncodingCache:
+    """Tests for the memoized ftfy wrapper used in event processing.
+
+    Technique: Specification-based — repeated inputs are served from cache.
+    """
+
+    def test_repeated_state_served_from_cache(self) -> None:
+        """Same raw state is fixed once and replayed from the cache."""
+        _fix_encoding.cache_clear()
+
+        first = _fix_encoding("22.5 Â°C")
+        second = _fix_encoding("22.5 Â°C")
+
+        assert first == second == "22.5 °C"
+        info = _fix_encoding.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
@@ -11,13 +11,18 @@ Test Techniques Used:
 
 from __future__ import annotations
 
+import re
+
 import pytest
 
 from lumehaven.adapters.openhab.units import (
+    _FORMATTERS,
     DEFAULT_UNITS,
+    _format_value,
     extract_unit_from_pattern,
     format_value,
     get_default_units,
+    get_default_units_view,
 )
 from tests.fixtures.openhab_responses import (
     CONTACT_ITEM,
@@ -119,6 +124,12 @@ class TestGetDefaultUnits:
         result["Temperature"] = "K"
         assert DEFAULT_UNITS["SI"]["Temperature"] == "°C"
 
+    def test_us_returns_copy_not_reference(self) -> None:
+        """US result is a fresh copy of the precomputed merge."""
+        result = get_default_units("US")
+        result["Temperature"] = "K"
+        assert get_default_units("US")["Temperature"] == "°F"
+
     def test_us_result_has_all_si_keys_plus_overrides(self) -> None:
         """US result contains all SI keys with overrides applied."""
         si_result = get_default_units("SI")
@@ -126,6 +137,28 @@ class TestGetDefaultUnits:
         assert set(us_result.keys()) == set(si_result.keys())
 
 
+class TestGetDefaultUnitsView:
+    """Tests for get_default_units_view() shared read-only mappings.
+
+    Technique: Specification-based Testing — same content, no copying.
+    """
+
+    @pytest.mark.parametrize("system", ["SI", "US"])
+    def test_matches_copying_variant(self, system: str) -> None:
+        """View content equals get_default_units() for the same system."""
+        assert dict(get_default_units_view(system)) == get_default_units(system)
+
+    def test_returns_shared_instance(self) -> None:
+        """Repeated calls return the same object instead of a copy."""
+        assert get_default_units_view("US") is get_default_units_view("US")
+
+    def test_view_is_read_only(self) -> None:
+        """Mutating the view raises instead of corrupting the defaults."""
+        view = get_default_units_view()
+        with pytest.raises(TypeError):
+            view["Temperature"] = "K"  # type: ignore[index]
+
+
 # =============================================================================
 # Tests: extract_unit_from_pattern() — using real fixture data
 # =============================================================================
@@ -224,6 +257,71 @@ class TestExtractUnitFromPatternSyntheticCases:
         assert format_str == expected_format
 
 
+class TestExtractUnitFromPatternScanEquivalence:
+    """Tests that the string scanner matches the reference regex grammar.
+
+    Technique: Equivalence Partitioning — specifier shapes and whitespace
+    variants, checked against the regex the scanner replaced as oracle.
+    """
+
+    PATTERN_REGEX = re.compile(r"(%\S*[fds])\s*(.*)")
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [
+            "%.1f °C",
+            "%d %%",
+            "%.1f\t°C",
+            "%.1f  °C  ",
+            "%.1f\xa0°C",
+            "%sabcd",
+            "%.1f°C",
+            "%unit%",
+            "%",
+            "%.1f\n°C",
+            "%.1f °C\nextra",
+        ],
+        ids=[
+            "float_unit",
+            "percent_escape",
+            "tab_separator",
+            "extra_whitespace",
+            "nbsp_separator",
+            "greedy_specifier",
+            "unit_without_space",
+            "placeholder_only",
+            "lone_percent",
+            "newline_separator",
+            "multiline_tail",
+        ],
+    )
+    def test_matches_regex(self, pattern: str) -> None:
+        """Scanner yields the same (unit, format) as the regex."""
+        match = self.PATTERN_REGEX.match(pattern)
+        expected = (
+            (match.group(2).replace("%%", "%"), match.group(1))
+            if match
+            else (pattern, "%s")
+        )
+
+        assert extract_unit_from_pattern(pattern) == expected
+
+
+class TestExtractUnitFromPatternInterning:
+    """Tests that extracted parts are interned.
+
+    Technique: Specification-based Testing — identity of equal results.
+    """
+
+    def test_equal_parts_share_identity(self) -> None:
+        """Format and unit from distinct patterns are the same objects."""
+        unit_a, format_a = extract_unit_from_pattern("%.1f °C")
+        unit_b, format_b = extract_unit_from_pattern("%.1f  °C")
+
+        assert format_a is format_b
+        assert unit_a is unit_b
+
+
 class TestExtractUnitFromPatternUnicode:
     """Tests for Unicode handling in patterns.
 
@@ -365,6 +463,80 @@ class TestFormatValueNonQuantityTypes:
         assert result == "CLOSED"
 
 
+class TestFormatValueNonNumericStates:
+    """Tests for non-numeric states paired with numeric formats.
+
+    Technique: Error Guessing — states float() or round() cannot format.
+    """
+
+    @pytest.mark.parametrize(
+        ("state", "format_str"),
+        [
+            ("ON", "%d"),
+            ("CLOSED", "%.1f"),
+            ("Partly Cloudy", "%.2f"),
+            ("inf", "%d"),
+            ("-inf", "%d"),
+            ("+inf", "%d"),
+            ("NaN", "%d"),
+            ("", "%.1f"),
+        ],
+        ids=[
+            "switch",
+            "contact",
+            "text",
+            "inf_as_int",
+            "negative_inf_as_int",
+            "positive_inf_as_int",
+            "nan_as_int",
+            "empty",
+        ],
+    )
+    def test_returned_unchanged(self, state: str, format_str: str) -> None:
+        """Non-numeric states are returned as-is instead of formatted."""
+        result = format_value(state, "", format_str, is_quantity_type=False)
+        assert result == state
+
+
+class TestFormatValueFloatParsing:
+    """Tests for states that float() accepts beyond plain ASCII numbers.
+
+    Technique: Equivalence Partitioning — whitespace, NaN and Unicode digits
+    are all parsed by float() and formatted like any other number.
+    """
+
+    @pytest.mark.parametrize(
+        ("state", "unit", "format_str", "is_quantity_type", "expected"),
+        [
+            ("  21.5", "", "%d", False, "22"),
+            (" 21.5 °C", "°C", "%.1f", True, "21.5"),
+            ("NaN", "", "%.1f", False, "nan"),
+            ("nan", "", "%5.1f", False, "  nan"),
+            ("٣", "", "%d", False, "3"),
+            ("１２", "", "%.1f", False, "12.0"),
+        ],
+        ids=[
+            "leading_whitespace",
+            "leading_whitespace_quantity",
+            "nan",
+            "nan_padded",
+            "arabic_indic_digit",
+            "fullwidth_digits",
+        ],
+    )
+    def test_formats_parsed_value(
+        self,
+        state: str,
+        unit: str,
+        format_str: str,
+        is_quantity_type: bool,
+        expected: str,
+    ) -> None:
+        """States float() can parse are formatted."""
+        result = format_value(state, unit, format_str, is_quantity_type)
+        assert result == expected
+
+
 class TestFormatValueBankersRounding:
     """Tests verifying Python's banker's rounding behavior.
 
@@ -411,6 +583,52 @@ class TestFormatValuePrecisionEdges:
         result = format_value("123456789.5", "", "%.1f", is_quantity_type=False)
         assert result == "123456789.5"
 
+    def test_precision_beyond_dispatch_table(self) -> None:
+        """Plain %.Nf specifiers outside the dispatch table still format."""
+        result = format_value("3.14159", "", "%.4f", is_quantity_type=False)
+        assert result == "3.1416"
+
+    def test_width_specifier_formats_via_printf(self) -> None:
+        """Specifiers other than %d/%.Nf still honor printf semantics."""
+        result = format_value("2.5", "", "%5.1f", is_quantity_type=False)
+        assert result == "  2.5"
+
+
+class TestFormatterDispatchTable:
+    """Tests that the direct formatters agree with printf-style formatting.
+
+    Technique: Equivalence Partitioning — every table entry against the
+    % operator as oracle, including rounding and sign edge cases.
+    """
+
+    @pytest.mark.parametrize("format_str", sorted(_FORMATTERS))
+    @pytest.mark.parametrize("number", [0.0, -0.4, 2.5, 3.5, -15.7, 1013.25])
+    def test_matches_printf(self, format_str: str, number: float) -> None:
+        """Each table entry renders exactly like format_str % number."""
+        expected = (
+            format_str % round(number) if format_str == "%d" else format_str % number
+        )
+        assert _FORMATTERS[format_str](number) == expected
+
+
+class TestFormatValueMemoization:
+    """Tests for memoized format_value() results.
+
+    Technique: Specification-based Testing — repeated inputs hit the cache.
+    """
+
+    def test_repeated_call_served_from_cache(self) -> None:
+        """Identical arguments are formatted once and then replayed."""
+        _format_value.cache_clear()
+
+        first = format_value("21.5678 °C", "°C", "%.1f", is_quantity_type=True)
+        second = format_value("21.5678 °C", "°C", "%.1f", is_quantity_type=True)
+
+        assert first == second == "21.6"
+        info = _format_value.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
 
 class TestFormatValueNoFormatting:
     """Tests for early return when no formatting is needed.
@@ -12,7 +12,7 @@ Coverage Target: Critical Risk (adapters/manager.py)
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from typing import TYPE_CHECKING
 
 from lumehaven.adapters.manager import AdapterManager
@@ -35,7 +35,7 @@ class TestLifecycleTransitions:
         adapter_manager: AdapterManager,
         signal_store: SignalStore,
         mock_adapter_factory: Callable[..., MockAdapter],
-        sample_signals: dict[str, Signal],
+        sample_signals: Mapping[str, Signal],
     ) -> None:
         """start_all() transitions adapter to connected and loads signals.
 
@@ -97,7 +97,7 @@ class TestLifecycleTransitions:
         self,
         adapter_manager: AdapterManager,
         mock_adapter_factory: Callable[..., MockAdapter],
-        sample_signals: dict[str, Signal],
+        sample_signals: Mapping[str, Signal],
     ) -> None:
         """Connected adapter gets a sync task for event streaming."""
         # Arrange
@@ -123,7 +123,7 @@ class TestLifecycleTransitions:
         self,
         adapter_manager: AdapterManager,
         mock_adapter_factory: Callable[..., MockAdapter],
-        sample_signals: dict[str, Signal],
+        sample_signals: Mapping[str, Signal],
     ) -> None:
         """stop_all() cancels all sync tasks gracefully."""
         # Arrange
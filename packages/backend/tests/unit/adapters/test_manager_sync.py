@@ -12,10 +12,11 @@ Coverage Target: Critical Risk (adapters/manager.py)
 from __future__ import annotations
 
 import asyncio
-import contextlib
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from typing import TYPE_CHECKING
 
+import pytest
+
 from lumehaven.adapters.manager import AdapterManager
 from lumehaven.core.signal import Signal
 from lumehaven.state.store import SignalStore
@@ -36,7 +37,7 @@ class TestSyncBehavior:
         adapter_manager: AdapterManager,
         signal_store: SignalStore,
         mock_adapter_factory: Callable[..., MockAdapter],
-        sample_signals: dict[str, Signal],
+        sample_signals: Mapping[str, Signal],
     ) -> None:
         """Events from adapter stream are published to SignalStore."""
         # Arrange
@@ -51,42 +52,26 @@ class TestSyncBehavior:
         )
         adapter_manager.add(adapter)
 
-        # Subscribe to store before starting
-        received_events: list[Signal] = []
-
-        async def collect_events() -> None:
-            async for signal in signal_store.subscribe():
-                received_events.append(signal)
-                break  # Just need one
-
-        collector_task = asyncio.create_task(collect_events())
+        # Register a subscriber queue before starting
+        queue = signal_store.register_subscriber()
 
         # Act
         await adapter_manager.start_all()
-
-        # Wait for event to be received
-        await wait_for_condition(
-            lambda: len(received_events) >= 1,
-            timeout=2.0,
-            description="event publication",
-        )
+        received = await asyncio.wait_for(queue.get(), timeout=2.0)
 
         # Assert
-        assert len(received_events) >= 1
-        assert received_events[0].id == "mock:temp_1"
-        assert received_events[0].value == "25.0"
+        assert received.id == "mock:temp_1"
+        assert received.value == "25.0"
 
         # Cleanup
-        collector_task.cancel()
-        with contextlib.suppress(asyncio.CancelledError):
-            await collector_task
+        signal_store.unregister_subscriber(queue)
         await adapter_manager.stop_all()
 
     async def test_stream_end_sets_disconnected_state(
         self,
         adapter_manager: AdapterManager,
         mock_adapter_factory: Callable[..., MockAdapter],
-        sample_signals: dict[str, Signal],
+        sample_signals: Mapping[str, Signal],
     ) -> None:
         """Event stream ending normally sets connected=False.
 
@@ -103,12 +88,9 @@ class TestSyncBehavior:
         # Act
         await adapter_manager.start_all()
 
-        # Wait for the sync task to detect stream closure
-        await wait_for_condition(
-            lambda: adapter_manager.states["closing-adapter"].connected is False,
-            timeout=2.0,
-            description="disconnection detection",
-        )
+        # Wait for stream closure; the sync task marks the adapter
+        # disconnected before it next yields to the event loop
+        await asyncio.wait_for(adapter.stream_ended.wait(), timeout=2.0)
 
         # Assert
         state = adapter_manager.states["closing-adapter"]
@@ -122,7 +104,7 @@ class TestSyncBehavior:
         self,
         adapter_manager: AdapterManager,
         mock_adapter_factory: Callable[..., MockAdapter],
-        sample_signals: dict[str, Signal],
+        sample_signals: Mapping[str, Signal],
     ) -> None:
         """Sync task reconnects after subscribe_events raises an error.
 
@@ -144,22 +126,16 @@ class TestSyncBehavior:
         await adapter.close_stream()
 
         # Wait for disconnection
-        await wait_for_condition(
-            lambda: state.connected is False,
-            timeout=2.0,
-            description="disconnection after stream close",
-        )
+        await asyncio.wait_for(adapter.stream_ended.wait(), timeout=2.0)
+        assert state.connected is False
 
         # The sync task should attempt reconnection
         # We verify by checking get_signals is called again
         initial_call_count = adapter.get_signals_call_count
+        adapter.get_signals_called.clear()
 
         # Wait for reconnect attempt (test uses 10ms retry delay)
-        await wait_for_condition(
-            lambda: adapter.get_signals_call_count > initial_call_count,
-            timeout=1.0,  # Fast with test's 10ms retry delay
-            description="reconnection attempt",
-        )
+        await asyncio.wait_for(adapter.get_signals_called.wait(), timeout=1.0)
 
         # Assert — reconnection was attempted
         assert adapter.get_signals_call_count > initial_call_count
@@ -171,7 +147,7 @@ class TestSyncBehavior:
         self,
         adapter_manager: AdapterManager,
         mock_adapter_factory: Callable[..., MockAdapter],
-        sample_signals: dict[str, Signal],
+        sample_signals: Mapping[str, Signal],
     ) -> None:
         """Successful reconnection resets retry_delay to INITIAL.
 
@@ -192,11 +168,8 @@ class TestSyncBehavior:
         await adapter.close_stream()
 
         # Wait for disconnect
-        await wait_for_condition(
-            lambda: state.connected is False,
-            timeout=2.0,
-            description="disconnection",
-        )
+        await asyncio.wait_for(adapter.stream_ended.wait(), timeout=2.0)
+        assert state.connected is False
 
         # After backoff, delay should have increased
         # Wait for reconnection
@@ -258,6 +231,37 @@ class TestMultipleAdapters:
         # Cleanup
         await adapter_manager.stop_all()
 
+    async def test_start_all_connects_adapters_concurrently(
+        self,
+        adapter_manager: AdapterManager,
+        mock_adapter_factory: Callable[..., MockAdapter],
+    ) -> None:
+        """start_all() overlaps adapter connects instead of running them in turn.
+
+        Each adapter's get_signals() waits on a shared barrier, which only
+        opens once both connects are in flight at the same time.
+        """
+        # Arrange
+        barrier = asyncio.Barrier(2)
+
+        async def get_signals_after_barrier() -> dict[str, Signal]:
+            await barrier.wait()
+            return {}
+
+        adapters = [mock_adapter_factory(_name=f"adapter-{i}") for i in range(2)]
+        for adapter in adapters:
+            adapter.get_signals = get_signals_after_barrier  # type: ignore[method-assign]
+            adapter_manager.add(adapter)
+
+        # Act — a sequential start would block on the barrier forever
+        await asyncio.wait_for(adapter_manager.start_all(), timeout=2.0)
+
+        # Assert
+        assert all(state.connected for state in adapter_manager.states.values())
+
+        # Cleanup
+        await adapter_manager.stop_all()
+
     async def test_stop_all_closes_all_adapters(
         self,
         adapter_manager: AdapterManager,
@@ -277,3 +281,58 @@ class TestMultipleAdapters:
         # Assert — all adapters closed
         for adapter in adapters:
             assert adapter.close_call_count >= 1
+
+    async def test_stop_all_closes_adapters_concurrently(
+        self,
+        adapter_manager: AdapterManager,
+        mock_adapter_factory: Callable[..., MockAdapter],
+    ) -> None:
+        """stop_all() overlaps adapter closes instead of running them in turn.
+
+        Each adapter's close() waits on a shared barrier, which only opens
+        once both closes are in flight at the same time.
+        """
+        # Arrange
+        barrier = asyncio.Barrier(2)
+
+        async def close_after_barrier() -> None:
+            await barrier.wait()
+
+        adapters = [mock_adapter_factory(_name=f"adapter-{i}") for i in range(2)]
+        for adapter in adapters:
+            adapter.close = close_after_barrier  # type: ignore[method-assign]
+            adapter_manager.add(adapter)
+
+        # Act — a sequential stop would block on the barrier forever
+        await asyncio.wait_for(adapter_manager.stop_all(), timeout=2.0)
+
+        # Assert
+        assert barrier.n_waiting == 0
+
+    async def test_stop_all_closes_remaining_adapters_when_one_fails(
+        self,
+        adapter_manager: AdapterManager,
+        mock_adapter_factory: Callable[..., MockAdapter],
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """A failing close() is logged and the other adapters still close.
+
+        Technique: Error Guessing — one adapter raising during shutdown.
+        """
+        # Arrange
+        failing = mock_adapter_factory(_name="failing")
+
+        async def failing_close() -> None:
+            raise RuntimeError("close failed")
+
+        failing.close = failing_close  # type: ignore[method-assign]
+        others = [mock_adapter_factory(_name=f"adapter-{i}") for i in range(2)]
+        for adapter in [failing, *others]:
+            adapter_manager.add(adapter)
+
+        # Act — does not raise
+        await adapter_manager.stop_all()
+
+        # Assert
+        assert all(adapter.close_call_count == 1 for adapter in others)
+        assert "Adapter 'failing' failed to close: close failed" in caplog.text
@@ -18,6 +18,14 @@ from lumehaven.core.signal import Signal
 # Test Implementations (Mock Adapters)
 # =============================================================================
 
+# Signal is frozen, so one instance can be shared by every event stream
+_EVENT_SIGNAL = Signal(id="event", value="test")
+
+
+async def _single_event() -> AsyncIterator[Signal]:
+    """Event stream shared by the mock adapters: yields one signal."""
+    yield _EVENT_SIGNAL
+
 
 class CompliantAdapter:
     """Fully compliant adapter implementing all Protocol requirements."""
@@ -41,10 +49,7 @@ class CompliantAdapter:
         return Signal(id=signal_id, value="test")
 
     def subscribe_events(self) -> AsyncIterator[Signal]:
-        async def _generator() -> AsyncIterator[Signal]:
-            yield Signal(id="event", value="test")
-
-        return _generator()
+        return _single_event()
 
     def is_connected(self) -> bool:
         return True
@@ -78,10 +83,7 @@ class MissingMethodAdapter:
         return Signal(id=signal_id, value="test")
 
     def subscribe_events(self) -> AsyncIterator[Signal]:
-        async def _generator() -> AsyncIterator[Signal]:
-            yield Signal(id="event", value="test")
-
-        return _generator()
+        return _single_event()
 
     def is_connected(self) -> bool:
         return True
@@ -112,10 +114,7 @@ class MissingPropertyAdapter:
         return Signal(id=signal_id, value="test")
 
     def subscribe_events(self) -> AsyncIterator[Signal]:
-        async def _generator() -> AsyncIterator[Signal]:
-            yield Signal(id="event", value="test")
-
-        return _generator()
+        return _single_event()
 
     def is_connected(self) -> bool:
         return True
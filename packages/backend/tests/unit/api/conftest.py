@@ -5,14 +5,16 @@ AdapterManager for testing route handlers without production dependencies.
 
 Key Fixtures:
 - signal_store: Isolated SignalStore (not the singleton)
-- app: FastAPI app with dependency overrides
+- shared_app: Session-wide FastAPI app with the routers included
+- app: The shared app with per-test dependency overrides
+- asgi_transport: Session-wide ASGI transport for the shared app
 - async_client: httpx AsyncClient for async endpoint testing
 - mock_adapter_manager: Configurable mock for /health endpoint
 """
 
 from __future__ import annotations
 
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterator
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
@@ -33,7 +35,7 @@ if TYPE_CHECKING:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class MockAdapterState:
     """Mock adapter state for testing /health endpoint."""
 
@@ -41,7 +43,7 @@ class MockAdapterState:
     connected: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class MockAdapter:
     """Minimal mock adapter with just the properties /health needs."""
 
@@ -59,7 +61,7 @@ class MockAdapter:
         return self._adapter_type
 
 
-@dataclass
+@dataclass(slots=True)
 class MockAdapterManager:
     """Mock AdapterManager with configurable states for /health testing.
 
@@ -91,35 +93,65 @@ def mock_adapter_factory() -> Callable[..., MockAdapter]:
     return _create
 
 
-@pytest.fixture
-def app(signal_store: SignalStore, mock_adapter_manager: MockAdapterManager) -> FastAPI:
-    """Create FastAPI app with injected test dependencies.
+@pytest.fixture(scope="session")
+def shared_app() -> FastAPI:
+    """Create the FastAPI app and include the routers once per session.
 
-    Overrides get_signal_store dependency to return the test fixture store.
-    Sets mock adapter_manager on app.state for /health endpoint.
+    Route and dependency graph construction is the costly part of app setup
+    and does not depend on the test, so it is shared. Per-test dependencies
+    are injected by the function-scoped `app` fixture.
     """
     test_app = FastAPI()
     test_app.include_router(routes_router)
     test_app.include_router(sse_router)
+    return test_app
 
+
+@pytest.fixture
+def app(
+    shared_app: FastAPI,
+    signal_store: SignalStore,
+    mock_adapter_manager: MockAdapterManager,
+) -> Iterator[FastAPI]:
+    """Provide the shared FastAPI app with injected test dependencies.
+
+    Overrides get_signal_store dependency to return the test fixture store.
+    Sets mock adapter_manager on app.state for /health endpoint.
+    Both are removed again after the test so no state leaks between tests.
+    """
     # Override dependency to use test store
-    test_app.dependency_overrides[get_signal_store] = lambda: signal_store
+    shared_app.dependency_overrides[get_signal_store] = lambda: signal_store
 
     # Set adapter manager on app state (accessed by /health)
-    test_app.state.adapter_manager = mock_adapter_manager
+    shared_app.state.adapter_manager = mock_adapter_manager
 
-    return test_app
+    yield shared_app
+
+    shared_app.dependency_overrides.clear()
+    del shared_app.state.adapter_manager
+
+
+@pytest.fixture(scope="session")
+def asgi_transport(shared_app: FastAPI) -> ASGITransport:
+    """ASGI transport bound to the shared app.
+
+    The transport holds no per-request state, so one instance serves all tests.
+    """
+    return ASGITransport(app=shared_app)
 
 
 @pytest.fixture
-async def async_client(app: FastAPI) -> AsyncIterator[AsyncClient]:
+async def async_client(
+    app: FastAPI,  # Applies the per-test dependency overrides
+    asgi_transport: ASGITransport,
+) -> AsyncIterator[AsyncClient]:
     """Async HTTP client for testing endpoints.
 
     Uses httpx AsyncClient with ASGI transport to call FastAPI directly
     without starting a real server.
     """
     async with AsyncClient(
-        transport=ASGITransport(app=app),
+        transport=asgi_transport,
         base_url="http://testserver",
     ) as client:
         yield client
@@ -14,9 +14,11 @@ from __future__ import annotations
 
 from collections.abc import Callable
 
+import pytest
+from fastapi import FastAPI
 from httpx import AsyncClient
 
-from lumehaven.state.store import SignalStore, get_signal_store
+from lumehaven.state.store import SignalStore
 from tests.fixtures.signals import create_signal
 from tests.unit.api.conftest import MockAdapter, MockAdapterManager, MockAdapterState
 
@@ -57,108 +59,51 @@ class TestHealthStatus:
         data = response.json()
         assert data["status"] == "healthy"
 
-    async def test_degraded_with_no_signals(
-        self,
-        async_client: AsyncClient,
-        mock_adapter_manager: MockAdapterManager,
-        mock_adapter_factory: Callable[..., MockAdapter],
-    ) -> None:
-        """Returns 'degraded' when signal_count is 0.
-
-        Condition: signal_count == 0 → degraded (regardless of adapters)
-        """
-        # Arrange — no signals in store, but adapter connected
-        adapter = mock_adapter_factory(_name="openhab", _adapter_type="openhab")
-        mock_adapter_manager.states["openhab"] = MockAdapterState(
-            adapter=adapter, connected=True
-        )
-
-        # Act
-        response = await async_client.get("/health")
-
-        # Assert
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "degraded"
-        assert data["signal_count"] == 0
-
-    async def test_degraded_with_no_adapters(
-        self,
-        async_client: AsyncClient,
-        signal_store: SignalStore,
-    ) -> None:
-        """Returns 'degraded' when no adapters are registered.
-
-        Condition: has_adapters == False → degraded
-        """
-        # Arrange — signals exist but no adapters
-        await signal_store.set(create_signal(id="test:temp"))
-        # mock_adapter_manager.states is empty by default
-
-        # Act
-        response = await async_client.get("/health")
-
-        # Assert
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "degraded"
-        assert data["adapters"] == []
-
-    async def test_degraded_with_disconnected_adapter(
+    @pytest.mark.parametrize(
+        ("signal_ids", "adapters"),
+        [
+            # signal_count == 0 → degraded (regardless of adapters)
+            ([], [("openhab", "openhab", True)]),
+            # has_adapters == False → degraded
+            (["test:temp"], []),
+            # all_connected == False → degraded
+            (["test:temp"], [("openhab", "openhab", False)]),
+            # Multiple adapters, one disconnected → degraded
+            (
+                ["test:temp"],
+                [("openhab", "openhab", True), ("homeassistant", "hass", False)],
+            ),
+        ],
+        ids=[
+            "no_signals",
+            "no_adapters",
+            "disconnected_adapter",
+            "one_of_multiple_adapters_disconnected",
+        ],
+    )
+    async def test_degraded_when_any_condition_fails(
         self,
         async_client: AsyncClient,
         signal_store: SignalStore,
         mock_adapter_manager: MockAdapterManager,
         mock_adapter_factory: Callable[..., MockAdapter],
+        signal_ids: list[str],
+        adapters: list[tuple[str, str, bool]],
     ) -> None:
-        """Returns 'degraded' when any adapter is disconnected.
+        """Returns 'degraded' when any healthy condition is not met.
 
-        Condition: all_connected == False → degraded
-        """
-        # Arrange — signals and adapter, but adapter disconnected
-        await signal_store.set(create_signal(id="test:temp"))
-
-        adapter = mock_adapter_factory(_name="openhab", _adapter_type="openhab")
-        mock_adapter_manager.states["openhab"] = MockAdapterState(
-            adapter=adapter,
-            connected=False,  # Disconnected!
-        )
-
-        # Act
-        response = await async_client.get("/health")
-
-        # Assert
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "degraded"
-
-    async def test_degraded_when_one_of_multiple_adapters_disconnected(
-        self,
-        async_client: AsyncClient,
-        signal_store: SignalStore,
-        mock_adapter_manager: MockAdapterManager,
-        mock_adapter_factory: Callable[..., MockAdapter],
-    ) -> None:
-        """Returns 'degraded' if any adapter in multi-adapter setup is disconnected.
-
-        Condition: Multiple adapters, one disconnected → degraded
+        Condition: signal_count == 0 OR NOT has_adapters OR NOT all_connected
         """
         # Arrange
-        await signal_store.set(create_signal(id="test:temp"))
-
-        connected_adapter = mock_adapter_factory(
-            _name="openhab", _adapter_type="openhab"
-        )
-        disconnected_adapter = mock_adapter_factory(
-            _name="homeassistant", _adapter_type="hass"
+        await signal_store.set_many(
+            {signal_id: create_signal(id=signal_id) for signal_id in signal_ids}
         )
 
-        mock_adapter_manager.states["openhab"] = MockAdapterState(
-            adapter=connected_adapter, connected=True
-        )
-        mock_adapter_manager.states["homeassistant"] = MockAdapterState(
-            adapter=disconnected_adapter, connected=False
-        )
+        for name, adapter_type, connected in adapters:
+            adapter = mock_adapter_factory(_name=name, _adapter_type=adapter_type)
+            mock_adapter_manager.states[name] = MockAdapterState(
+                adapter=adapter, connected=connected
+            )
 
         # Act
         response = await async_client.get("/health")
@@ -167,6 +112,8 @@ class TestHealthStatus:
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "degraded"
+        assert data["signal_count"] == len(signal_ids)
+        assert len(data["adapters"]) == len(adapters)
 
 
 class TestHealthResponse:
@@ -182,8 +129,9 @@ class TestHealthResponse:
     ) -> None:
         """Health response includes correct signal_count."""
         # Arrange — add 3 signals
-        for i in range(3):
-            await signal_store.set(create_signal(id=f"test:sig_{i}"))
+        await signal_store.set_many(
+            {f"test:sig_{i}": create_signal(id=f"test:sig_{i}") for i in range(3)}
+        )
 
         # Act
         response = await async_client.get("/health")
@@ -205,56 +153,38 @@ class TestHealthResponse:
         data = response.json()
         assert data["subscriber_count"] == 0
 
+    @pytest.mark.parametrize(
+        "adapters",
+        [
+            [("openhab-main", "openhab", True)],
+            [("openhab", "openhab", True), ("hass", "homeassistant", False)],
+        ],
+        ids=["single_adapter", "multiple_adapters"],
+    )
     async def test_returns_adapter_list_with_status(
         self,
         async_client: AsyncClient,
         mock_adapter_manager: MockAdapterManager,
         mock_adapter_factory: Callable[..., MockAdapter],
+        adapters: list[tuple[str, str, bool]],
     ) -> None:
-        """Health response includes adapter list with name, type, connected."""
+        """Health response lists every adapter with name, type, connected."""
         # Arrange
-        adapter = mock_adapter_factory(_name="openhab-main", _adapter_type="openhab")
-        mock_adapter_manager.states["openhab-main"] = MockAdapterState(
-            adapter=adapter, connected=True
-        )
-
-        # Act
-        response = await async_client.get("/health")
-
-        # Assert
-        data = response.json()
-        assert len(data["adapters"]) == 1
-        adapter_status = data["adapters"][0]
-        assert adapter_status["name"] == "openhab-main"
-        assert adapter_status["type"] == "openhab"
-        assert adapter_status["connected"] is True
-
-    async def test_returns_multiple_adapters(
-        self,
-        async_client: AsyncClient,
-        mock_adapter_manager: MockAdapterManager,
-        mock_adapter_factory: Callable[..., MockAdapter],
-    ) -> None:
-        """Health response lists all registered adapters."""
-        # Arrange — two adapters
-        adapter1 = mock_adapter_factory(_name="openhab", _adapter_type="openhab")
-        adapter2 = mock_adapter_factory(_name="hass", _adapter_type="homeassistant")
-
-        mock_adapter_manager.states["openhab"] = MockAdapterState(
-            adapter=adapter1, connected=True
-        )
-        mock_adapter_manager.states["hass"] = MockAdapterState(
-            adapter=adapter2, connected=False
-        )
+        for name, adapter_type, connected in adapters:
+            adapter = mock_adapter_factory(_name=name, _adapter_type=adapter_type)
+            mock_adapter_manager.states[name] = MockAdapterState(
+                adapter=adapter, connected=connected
+            )
 
         # Act
         response = await async_client.get("/health")
 
         # Assert
         data = response.json()
-        assert len(data["adapters"]) == 2
-        adapter_names = {a["name"] for a in data["adapters"]}
-        assert adapter_names == {"openhab", "hass"}
+        assert data["adapters"] == [
+            {"name": name, "type": adapter_type, "connected": connected}
+            for name, adapter_type, connected in adapters
+        ]
 
 
 class TestHealthGracefulDegradation:
@@ -265,29 +195,19 @@ class TestHealthGracefulDegradation:
 
     async def test_handles_missing_adapter_manager(
         self,
-        signal_store: SignalStore,
+        app: FastAPI,
+        async_client: AsyncClient,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Returns degraded status when adapter_manager not set on app.state.
 
         This can happen during early startup before adapters are initialized.
         """
-        from fastapi import FastAPI
-        from httpx import ASGITransport, AsyncClient
-
-        from lumehaven.api.routes import router as routes_router
-
         # Arrange — app WITHOUT adapter_manager on state
-        app = FastAPI()
-        app.include_router(routes_router)
-        app.dependency_overrides[get_signal_store] = lambda: signal_store
-        # Note: NOT setting app.state.adapter_manager
+        monkeypatch.delattr(app.state, "adapter_manager")
 
         # Act
-        async with AsyncClient(
-            transport=ASGITransport(app=app),
-            base_url="http://testserver",
-        ) as client:
-            response = await client.get("/health")
+        response = await async_client.get("/health")
 
         # Assert — should not crash, returns degraded
         assert response.status_code == 200
@@ -16,7 +16,7 @@ import pytest
 from httpx import AsyncClient
 
 from lumehaven.api.routes import SignalResponse, SignalsResponse
-from lumehaven.core.signal import SignalType
+from lumehaven.core.signal import Signal, SignalType
 from lumehaven.state.store import SignalStore
 from tests.fixtures.signals import (
     ALL_TEST_SIGNALS,
@@ -52,8 +52,9 @@ class TestListSignals:
     ) -> None:
         """Returns all signals currently in store."""
         # Arrange — add signals
-        for signal in TEMPERATURE_SIGNALS:
-            await signal_store.set(signal)
+        await signal_store.set_many(
+            {signal.id: signal for signal in TEMPERATURE_SIGNALS}
+        )
 
         # Act
         response = await async_client.get("/api/signals")
@@ -75,8 +76,7 @@ class TestListSignals:
     ) -> None:
         """Response count field matches actual signals length."""
         # Arrange
-        for signal in ALL_TEST_SIGNALS:
-            await signal_store.set(signal)
+        await signal_store.set_many({signal.id: signal for signal in ALL_TEST_SIGNALS})
 
         # Act
         response = await async_client.get("/api/signals")
@@ -118,6 +118,72 @@ class TestListSignals:
         assert sig["signal_type"] == "number"
 
 
+class TestListSignalsConditional:
+    """Tests for ETag / If-None-Match handling on GET /api/signals.
+
+    Technique: State Transition Testing — unchanged store → 304,
+    store written since the ETag was issued → 200 with a new ETag.
+    """
+
+    async def test_sets_weak_etag(
+        self,
+        async_client: AsyncClient,
+    ) -> None:
+        """Full responses carry a weak ETag header."""
+        response = await async_client.get("/api/signals")
+
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('W/"')
+
+    @pytest.mark.parametrize(
+        "header_template",
+        ["{etag}", "{opaque}", 'W/"other", {etag}', "*"],
+        ids=["exact", "strong_form", "in_list", "wildcard"],
+    )
+    async def test_returns_304_when_if_none_match_matches(
+        self,
+        async_client: AsyncClient,
+        signal_store: SignalStore,
+        header_template: str,
+    ) -> None:
+        """Matching If-None-Match returns an empty 304 with the same ETag."""
+        # Arrange
+        await signal_store.set(create_signal(id="test:temp"))
+        etag = (await async_client.get("/api/signals")).headers["etag"]
+        header = header_template.format(etag=etag, opaque=etag.removeprefix("W/"))
+
+        # Act
+        response = await async_client.get(
+            "/api/signals", headers={"If-None-Match": header}
+        )
+
+        # Assert
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    async def test_returns_200_when_store_changed(
+        self,
+        async_client: AsyncClient,
+        signal_store: SignalStore,
+    ) -> None:
+        """A write after the ETag was issued yields a full response and new ETag."""
+        # Arrange
+        await signal_store.set(create_signal(id="test:temp", value="20.0"))
+        etag = (await async_client.get("/api/signals")).headers["etag"]
+        await signal_store.set(create_signal(id="test:temp", value="21.0"))
+
+        # Act
+        response = await async_client.get(
+            "/api/signals", headers={"If-None-Match": etag}
+        )
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert response.json()["signals"][0]["value"] == "21.0"
+
+
 class TestGetSignal:
     """Tests for GET /api/signals/{signal_id} endpoint.
 
@@ -242,6 +308,23 @@ class TestSignalResponseModel:
         assert response.unit == ""
         assert response.label == ""
 
+    @pytest.mark.parametrize(
+        "signal",
+        [*ALL_TEST_SIGNALS, create_signal(id="test:null", value=None)],
+        ids=lambda signal: signal.id,
+    )
+    def test_from_signal_matches_validated_model(self, signal: Signal) -> None:
+        """from_signal() skips validation but yields the same model as validating."""
+        # Arrange
+        validated = SignalResponse.model_validate(signal, from_attributes=True)
+
+        # Act
+        response = SignalResponse.from_signal(signal)
+
+        # Assert
+        assert response == validated
+        assert response.model_dump_json() == validated.model_dump_json()
+
 
 class TestSignalsResponseModel:
     """Tests for SignalsResponse Pydantic model.
@@ -328,8 +411,9 @@ class TestMetricsEndpoint:
     ) -> None:
         """Metrics includes signals.stored count."""
         # Arrange — add some signals
-        for i in range(5):
-            await signal_store.set(create_signal(id=f"test:sig_{i}"))
+        await signal_store.set_many(
+            {f"test:sig_{i}": create_signal(id=f"test:sig_{i}") for i in range(5)}
+        )
 
         # Act
         response = await async_client.get("/metrics")
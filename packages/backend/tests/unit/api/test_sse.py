@@ -18,11 +18,14 @@ import json
 
 import pytest
 from httpx import AsyncClient
+from sse_starlette.sse import ensure_bytes
 
-from lumehaven.api.sse import signal_event_generator
+from lumehaven.api.sse import _encode_signal_event, signal_event_generator
+from lumehaven.core.signal import Signal
 from lumehaven.state.store import SignalStore
 from tests.fixtures.async_utils import wait_for_condition
 from tests.fixtures.signals import create_signal
+from tests.fixtures.sse import collect_sse_events, parse_sse_frame
 
 
 class TestSSEEventFormat:
@@ -38,40 +41,12 @@ class TestSSEEventFormat:
         """Generated events have 'event' key set to 'signal'."""
         # Arrange
         signal = create_signal(id="test:temp", value="21.5")
-        received_event: dict[str, str] | None = None
-
-        async def collect_one_event() -> None:
-            nonlocal received_event
-            async for event in signal_event_generator(signal_store):
-                received_event = event
-                break  # Got one event, exit
-
-        async def publish_signal() -> None:
-            await wait_for_condition(
-                lambda: signal_store.subscriber_count() >= 1,
-                description="subscriber registered",
-            )
-            await signal_store.publish(signal)
 
         # Act
-        collector_task = asyncio.create_task(collect_one_event())
-        publisher_task = asyncio.create_task(publish_signal())
-
-        try:
-            await asyncio.wait_for(collector_task, timeout=1.0)
-        except TimeoutError:
-            pytest.fail("Timed out waiting for SSE event")
-        finally:
-            collector_task.cancel()
-            publisher_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await collector_task
-            with contextlib.suppress(asyncio.CancelledError):
-                await publisher_task
+        events = await collect_sse_events(signal_store, [signal], count=1)
 
         # Assert
-        assert received_event is not None
-        assert received_event["event"] == "signal"
+        assert events[0]["event"] == "signal"
 
     async def test_data_is_json_signal(
         self,
@@ -86,40 +61,12 @@ class TestSSEEventFormat:
             unit="°C",
             label="Temperature",
         )
-        received_event: dict[str, str] | None = None
-
-        async def collect_one_event() -> None:
-            nonlocal received_event
-            async for event in signal_event_generator(signal_store):
-                received_event = event
-                break
-
-        async def publish_signal() -> None:
-            await wait_for_condition(
-                lambda: signal_store.subscriber_count() >= 1,
-                description="subscriber registered",
-            )
-            await signal_store.publish(signal)
 
         # Act
-        collector_task = asyncio.create_task(collect_one_event())
-        publisher_task = asyncio.create_task(publish_signal())
-
-        try:
-            await asyncio.wait_for(collector_task, timeout=1.0)
-        except TimeoutError:
-            pytest.fail("Timed out waiting for SSE event")
-        finally:
-            collector_task.cancel()
-            publisher_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await collector_task
-            with contextlib.suppress(asyncio.CancelledError):
-                await publisher_task
+        events = await collect_sse_events(signal_store, [signal], count=1)
 
         # Assert — data is valid JSON
-        assert received_event is not None
-        data = json.loads(received_event["data"])
+        data = json.loads(events[0]["data"])
         assert data["id"] == "test:temp"
         assert data["value"] == 21.5
         assert data["display_value"] == "21.5"
@@ -128,6 +75,64 @@ class TestSSEEventFormat:
         assert data["available"] is True
         assert data["signal_type"] == "string"
 
+    async def test_subscribers_share_one_payload(
+        self,
+        signal_store: SignalStore,
+    ) -> None:
+        """One published signal is encoded once for all subscribers."""
+        # Arrange
+        generators = [signal_event_generator(signal_store) for _ in range(2)]
+        tasks = [asyncio.create_task(anext(gen)) for gen in generators]
+        await wait_for_condition(
+            lambda: signal_store.subscriber_count() >= 2,
+            description="subscribers registered",
+        )
+
+        # Act
+        await signal_store.publish(create_signal(id="test:temp", value="21.5"))
+        first, second = await asyncio.wait_for(asyncio.gather(*tasks), timeout=1.0)
+
+        # Assert
+        assert first is second
+
+        # Cleanup
+        for gen in generators:
+            await gen.aclose()
+
+    def test_payload_cache_distinguishes_equal_signals(self) -> None:
+        """Signals that compare equal but serialize differently stay distinct.
+
+        Technique: Error Guessing — 1 == True == 1.0 in Python, but not in JSON.
+        """
+        # Arrange
+        signals = [
+            Signal(id="test:x", value=1, display_value="1"),
+            Signal(id="test:x", value=True, display_value="1"),
+            Signal(id="test:x", value=1.0, display_value="1"),
+        ]
+
+        # Act
+        values = [
+            json.loads(parse_sse_frame(_encode_signal_event(s))["data"])["value"]
+            for s in signals
+        ]
+
+        # Assert
+        assert signals[0] == signals[1] == signals[2]
+        assert [type(v) for v in values] == [int, bool, float]
+
+    def test_frame_matches_sse_starlette_encoding(self) -> None:
+        """Pre-encoded frames are byte-identical to sse-starlette's own framing."""
+        # Arrange
+        signal = create_signal(id="test:temp", value="21.5", unit="°C")
+        payload = json.dumps(signal.to_dict(), ensure_ascii=False)
+
+        # Act
+        frame = _encode_signal_event(signal)
+
+        # Assert
+        assert frame == ensure_bytes({"event": "signal", "data": payload}, "\r\n")
+
 
 class TestSSESubscription:
     """Tests for SSE subscription lifecycle.
@@ -171,46 +176,31 @@ class TestSSESubscription:
             create_signal(id="test:1", value="1"),
             create_signal(id="test:2", value="2"),
         ]
-        received: list[dict[str, str]] = []
-
-        async def collect_events() -> None:
-            async for event in signal_event_generator(signal_store):
-                received.append(event)
-                if len(received) >= 2:
-                    break
-
-        async def publish_signals() -> None:
-            await wait_for_condition(
-                lambda: signal_store.subscriber_count() >= 1,
-                description="subscriber registered",
-            )
-            for sig in signals_to_publish:
-                await signal_store.publish(sig)
 
         # Act
-        collector_task = asyncio.create_task(collect_events())
-        publisher_task = asyncio.create_task(publish_signals())
-
-        try:
-            await asyncio.wait_for(collector_task, timeout=2.0)
-        except TimeoutError:
-            pytest.fail(
-                f"Timed out waiting for 2 SSE events; received {len(received)} "
-                "event(s) within 2.0 seconds."
-            )
-        finally:
-            collector_task.cancel()
-            publisher_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await collector_task
-            with contextlib.suppress(asyncio.CancelledError):
-                await publisher_task
+        received = await collect_sse_events(
+            signal_store, signals_to_publish, count=2, timeout=2.0
+        )
 
         # Assert
         assert len(received) == 2
         ids = {json.loads(e["data"])["id"] for e in received}
         assert ids == {"test:1", "test:2"}
 
+    async def test_missing_event_fails_with_progress(
+        self,
+        signal_store: SignalStore,
+    ) -> None:
+        """collect_sse_events reports which event it was still waiting for."""
+        # Act / Assert
+        with pytest.raises(pytest.fail.Exception, match="SSE event 2 of 2"):
+            await collect_sse_events(
+                signal_store,
+                [create_signal(id="test:1", value="1")],
+                count=2,
+                timeout=0.05,
+            )
+
 
 class TestSSEClientDisconnect:
     """Tests for client disconnect and cleanup.
@@ -1,7 +1,6 @@
 """Unit-specific test configuration and fixtures.
 
 Fixtures here are available to all unit tests but not integration tests.
+HTTP calls to smart home systems are mocked with pytest-httpx's httpx_mock
+fixture rather than a hand-rolled client double.
 """
-
-# TODO: Add mock_httpx_client fixture when pytest-mock is added
-# See: https://pytest-mock.readthedocs.io/
@@ -49,8 +49,8 @@ class TestLumehavenError:
 class TestSmartHomeConnectionError:
     """Condition Coverage tests for SmartHomeConnectionError.
 
-    The constructor has a branch: if cause: message += f": {cause}"
-    We test both branches.
+    The constructor has a condition: suffix = f": {cause}" if cause else ""
+    We test both outcomes.
     """
 
     def test_stores_all_attributes(self) -> None:
@@ -9,12 +9,11 @@ Test Techniques Used:
 - Error Guessing: Mutation of frozen dataclass, missing fields
 """
 
-import warnings
-
 import pytest
 
 from lumehaven.core.signal import (
     NULL_VALUE,
+    UNDEFINED_STATES,
     UNDEFINED_VALUE,
     Signal,
     SignalType,
@@ -377,7 +376,7 @@ class TestSignalRoundTrip:
 class TestIsUndefined:
     """Branch Coverage testing for is_undefined() — now deprecated.
 
-    The function tests: value in (UNDEFINED_VALUE, NULL_VALUE)
+    The function tests: value in UNDEFINED_STATES
     We need both True branches and the False branch.
     """
 
@@ -392,11 +391,10 @@ class TestIsUndefined:
         ],
         ids=["UNDEF", "NULL", "normal-ON", "normal-numeric", "empty-string"],
     )
+    @pytest.mark.filterwarnings("ignore:is_undefined.*ADR-010:DeprecationWarning")
     def test_is_undefined(self, value: str, expected: bool) -> None:
         """is_undefined() correctly identifies undefined states."""
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", DeprecationWarning)
-            assert is_undefined(value) is expected
+        assert is_undefined(value) is expected
 
     def test_emits_deprecation_warning(self) -> None:
         """is_undefined() emits DeprecationWarning per ADR-010.
@@ -417,3 +415,7 @@ class TestSentinelConstants:
     def test_null_value_constant(self) -> None:
         """NULL_VALUE matches OpenHAB's null state string."""
         assert NULL_VALUE == "NULL"
+
+    def test_undefined_states_contains_both_sentinels(self) -> None:
+        """UNDEFINED_STATES is exactly the two sentinel strings."""
+        assert frozenset({UNDEFINED_VALUE, NULL_VALUE}) == UNDEFINED_STATES
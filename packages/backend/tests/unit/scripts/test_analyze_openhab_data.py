@@ -15,7 +15,9 @@ in the autouse fixture to prevent cross-test contamination.
 from __future__ import annotations
 
 import json
+from collections.abc import Callable, Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 from unittest.mock import patch
 
@@ -33,8 +35,10 @@ from tests.scripts.analyze_openhab_data import (
     anonymize_name,
     anonymize_string,
     main,
+    parse_items,
     parse_items_snapshot,
     parse_root_snapshot,
+    parse_sse_content,
     parse_sse_events,
     save_json_report,
 )
@@ -61,106 +65,163 @@ def _write_json(path: Path, data: Any) -> None:
     path.write_text(json.dumps(data))
 
 
-def _make_item(
-    *,
-    name: str = "LivingRoom_Temperature",
-    item_type: str = "Number:Temperature",
-    state: str = "21.5",
-    label: str = "Living Room Temp",
-    link: str = "http://openhab:8080/rest/items/LivingRoom_Temperature",
-    state_description: dict[str, Any] | None = None,
-    transformed_state: str | None = None,
-    group_names: list[str] | None = None,
-) -> dict[str, Any]:
-    """Factory for minimal OpenHAB item dicts."""
-    item: dict[str, Any] = {
-        "name": name,
-        "type": item_type,
-        "state": state,
-        "label": label,
-        "link": link,
+# Minimal OpenHAB item; optional fields (stateDescription, transformedState,
+# groupNames) are only present when a test passes them.
+_BASE_ITEM: Mapping[str, Any] = MappingProxyType(
+    {
+        "name": "LivingRoom_Temperature",
+        "type": "Number:Temperature",
+        "state": "21.5",
+        "label": "Living Room Temp",
+        "link": "http://openhab:8080/rest/items/LivingRoom_Temperature",
     }
-    if state_description is not None:
-        item["stateDescription"] = state_description
-    if transformed_state is not None:
-        item["transformedState"] = transformed_state
-    if group_names is not None:
-        item["groupNames"] = group_names
-    return item
-
-
-# =============================================================================
-# Anonymization
-# =============================================================================
-
-
-class TestAnonymizeIp:
-    """Tests for anonymize_ip() — consistent IP address anonymization.
-
-    Technique: State Transition — same IP always gets same anonymized value.
-    """
-
-    def test_first_ip_gets_first_index(self) -> None:
-        assert anonymize_ip("10.0.0.1") == "192.168.1.1"
-
-    def test_second_ip_gets_second_index(self) -> None:
-        anonymize_ip("10.0.0.1")
-        assert anonymize_ip("10.0.0.2") == "192.168.1.2"
-
-    def test_same_ip_returns_same_mapping(self) -> None:
-        """Consistency: repeated calls with same IP return identical result."""
-        first = anonymize_ip("172.16.0.100")
-        second = anonymize_ip("172.16.0.100")
-        assert first == second
+)
 
 
-class TestAnonymizeName:
-    """Tests for anonymize_name() — device/item name anonymization.
+def _make_item(**fields: Any) -> dict[str, Any]:
+    """Factory for minimal OpenHAB item dicts.
 
-    Technique: Equivalence Partitioning — names with underscores vs without.
+    Args:
+        **fields: Item fields by their OpenHAB REST name (e.g. type,
+            stateDescription), overriding or extending _BASE_ITEM.
     """
+    return {**_BASE_ITEM, **fields}
+
+
+_NEW_ITEM_TYPE = "SyntheticTestType"
+
+
+# Items payload variants shared by the parse_items() tests. parse_items() only
+# reads the dicts (anonymize_item() copies), so one instance per variant is safe.
+_ITEM_VARIANTS: dict[str, list[dict[str, Any]]] = {
+    "temperature_and_switch": [
+        _make_item(),
+        _make_item(name="Kitchen_Light", type="Switch", state="ON"),
+    ],
+    "switches_and_dimmer": [
+        _make_item(type="Switch", state="ON"),
+        _make_item(type="Switch", state="OFF", name="Other_Switch"),
+        _make_item(type="Dimmer", state="50", name="Hall_Dimmer"),
+    ],
+    "undef_and_null": [
+        _make_item(state="UNDEF"),
+        _make_item(state="NULL", name="Offline_Sensor"),
+    ],
+    "state_pattern": [_make_item(stateDescription={"pattern": "%.1f °C"})],
+    "mojibake": [_make_item(state="21.5 Â°C")],
+    "new_type": [
+        _make_item(type=_NEW_ITEM_TYPE, state="42", name="Test_Device"),
+    ],
+    "transformed_state": [_make_item(transformedState="21.5 °C")],
+}
+
+
+def _sse_log(data: Any) -> str:
+    """Format one JSON data block as it appears in a recorded SSE log."""
+    return f"data: {json.dumps(data)}\n\n"
+
+
+# SSE log texts shared by the parse_sse_content() tests.
+_TOPIC_EVENT_LOG = _sse_log(
+    {
+        "topic": "openhab/items/Temp/state",
+        "type": "ItemStateEvent",
+        "payload": json.dumps({"type": "Decimal", "value": "21.5"}),
+    }
+)
+_SUBSCRIPTION_BATCH_LOG = _sse_log(
+    {
+        "Temp_Sensor": {"state": "21.5", "type": "Decimal"},
+        "Light_Switch": {"state": "ON", "type": "OnOff"},
+    }
+)
+_DISPLAY_STATE_LOG = _sse_log(
+    {"Temp": {"state": "21.5", "type": "Decimal", "displayState": "21.5 °C"}}
+)
 
-    def test_name_with_underscore_keeps_suffix(self) -> None:
-        """Multi-part names preserve the last segment as a type hint."""
-        result = anonymize_name("LivingRoom_Temperature")
-        assert result == "Device1_Temperature"
-
-    def test_name_without_underscore_uses_item_prefix(self) -> None:
-        """Single-word names use the Item_ prefix."""
-        result = anonymize_name("Thermostat")
-        assert result == "Item_1"
-
-    def test_consistent_mapping(self) -> None:
-        """Same name always maps to same anonymized name."""
-        first = anonymize_name("Kitchen_Humidity")
-        second = anonymize_name("Kitchen_Humidity")
-        assert first == second
 
-    def test_different_names_get_different_numbers(self) -> None:
-        a = anonymize_name("Device_A")
-        b = anonymize_name("Device_B")
-        assert a != b
+# =============================================================================
+# Anonymization
+# =============================================================================
 
 
-class TestAnonymizeString:
-    """Tests for anonymize_string() — general string anonymization.
+class TestAnonymizeValues:
+    """Tests for anonymize_ip(), anonymize_name() and anonymize_string().
 
-    Technique: Specification-based Testing — IP and phone number replacement.
+    Technique: Equivalence Partitioning — IPs, names with and without
+    underscores, strings with IPs/phone numbers/nothing sensitive.
+    Technique: State Transition — the caches give consistent mappings.
     """
 
-    def test_replaces_ip_addresses(self) -> None:
-        result = anonymize_string("Connected to 10.0.0.1 OK")
-        assert "10.0.0.1" not in result
-        assert "192.168.1." in result
-
-    def test_replaces_phone_numbers(self) -> None:
-        result = anonymize_string("Phone: 1234567890123")
-        assert "1234567890123" not in result
-        assert "1234567890" in result
-
-    def test_preserves_non_sensitive_text(self) -> None:
-        result = anonymize_string("Temperature is 21.5 °C")
-        assert result == "Temperature is 21.5 °C"
+    @pytest.mark.parametrize(
+        ("anonymize", "value", "expected"),
+        [
+            pytest.param(anonymize_ip, "10.0.0.1", "192.168.1.1", id="ip"),
+            pytest.param(
+                anonymize_name,
+                "LivingRoom_Temperature",
+                "Device1_Temperature",
+                id="name-keeps-suffix",
+            ),
+            pytest.param(
+                anonymize_name, "Thermostat", "Item_1", id="name-without-underscore"
+            ),
+            pytest.param(
+                anonymize_string,
+                "Connected to 10.0.0.1 OK",
+                "Connected to 192.168.1.1 OK",
+                id="string-ip",
+            ),
+            pytest.param(
+                anonymize_string,
+                "Phone: 1234567890123",
+                "Phone: 1234567890",
+                id="string-phone",
+            ),
+            pytest.param(
+                anonymize_string,
+                "Temperature is 21.5 °C",
+                "Temperature is 21.5 °C",
+                id="string-non-sensitive",
+            ),
+        ],
+    )
+    def test_first_value_mapping(
+        self, anonymize: Callable[[str], str], value: str, expected: str
+    ) -> None:
+        assert anonymize(value) == expected
+
+    @pytest.mark.parametrize(
+        ("anonymize", "first", "second", "expected"),
+        [
+            pytest.param(anonymize_ip, "10.0.0.1", "10.0.0.2", "192.168.1.2", id="ip"),
+            pytest.param(
+                anonymize_name, "Device_A", "Device_B", "Device2_B", id="name"
+            ),
+        ],
+    )
+    def test_next_value_gets_next_index(
+        self,
+        anonymize: Callable[[str], str],
+        first: str,
+        second: str,
+        expected: str,
+    ) -> None:
+        anonymize(first)
+        assert anonymize(second) == expected
+
+    @pytest.mark.parametrize(
+        ("anonymize", "value"),
+        [
+            pytest.param(anonymize_ip, "172.16.0.100", id="ip"),
+            pytest.param(anonymize_name, "Kitchen_Humidity", id="name"),
+        ],
+    )
+    def test_same_value_returns_same_mapping(
+        self, anonymize: Callable[[str], str], value: str
+    ) -> None:
+        """Consistency: repeated calls with the same value are identical."""
+        assert anonymize(value) == anonymize(value)
 
 
 class TestAnonymizeItem:
@@ -181,7 +242,7 @@ class TestAnonymizeItem:
         assert "192.168.50.10" not in result["link"]
 
     def test_anonymizes_group_names(self) -> None:
-        item = _make_item(group_names=["gLivingRoom_Lights", "gAll"])
+        item = _make_item(groupNames=["gLivingRoom_Lights", "gAll"])
         result = anonymize_item(item)
         assert all(g.startswith("g") for g in result["groupNames"])
         assert "gLivingRoom_Lights" not in result["groupNames"]
@@ -193,7 +254,7 @@ class TestAnonymizeItem:
         assert item["name"] == "Original_Name"
 
     def test_anonymizes_transformed_state(self) -> None:
-        item = _make_item(transformed_state="10.0.0.1 online")
+        item = _make_item(transformedState="10.0.0.1 online")
         result = anonymize_item(item)
         assert "10.0.0.1" not in result["transformedState"]
 
@@ -203,172 +264,127 @@ class TestAnonymizeItem:
 # =============================================================================
 
 
-class TestParseItemsSnapshot:
-    """Tests for parse_items_snapshot() — item JSON parsing.
+class TestParseItems:
+    """Tests for parse_items() and parse_items_snapshot() — item parsing.
 
     Technique: Specification-based Testing — populates report fields correctly.
     """
 
-    def test_counts_total_items(self, tmp_path: Path) -> None:
-        items = [
-            _make_item(),
-            _make_item(
-                name="Kitchen_Light",
-                item_type="Switch",
-                state="ON",
-            ),
-        ]
-        _write_json(tmp_path / "items.json", items)
+    def test_snapshot_reads_items_from_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "items.json"
+        _write_json(path, _ITEM_VARIANTS["temperature_and_switch"])
 
         report = AnalysisReport()
-        parse_items_snapshot(tmp_path / "items.json", report)
+        parse_items_snapshot(path, report)
         assert report.total_items == 2
+        assert report.item_types["Switch"].count == 1
 
-    def test_tracks_item_types(self, tmp_path: Path) -> None:
-        items = [
-            _make_item(item_type="Switch", state="ON"),
-            _make_item(item_type="Switch", state="OFF", name="Other_Switch"),
-            _make_item(item_type="Dimmer", state="50", name="Hall_Dimmer"),
-        ]
-        _write_json(tmp_path / "items.json", items)
+    def test_counts_total_items(self) -> None:
+        report = AnalysisReport()
+        parse_items(_ITEM_VARIANTS["temperature_and_switch"], report)
+        assert report.total_items == 2
 
+    def test_tracks_item_types(self) -> None:
         report = AnalysisReport()
-        parse_items_snapshot(tmp_path / "items.json", report)
+        parse_items(_ITEM_VARIANTS["switches_and_dimmer"], report)
         assert report.item_types["Switch"].count == 2
         assert report.item_types["Dimmer"].count == 1
 
-    def test_tracks_special_states(self, tmp_path: Path) -> None:
-        items = [
-            _make_item(state="UNDEF"),
-            _make_item(state="NULL", name="Offline_Sensor"),
-        ]
-        _write_json(tmp_path / "items.json", items)
-
+    def test_tracks_special_states(self) -> None:
         report = AnalysisReport()
-        parse_items_snapshot(tmp_path / "items.json", report)
+        parse_items(_ITEM_VARIANTS["undef_and_null"], report)
         assert report.special_states["UNDEF"] == 1
         assert report.special_states["NULL"] == 1
 
-    def test_extracts_state_description_patterns(self, tmp_path: Path) -> None:
-        items = [
-            _make_item(
-                state_description={"pattern": "%.1f °C"},
-            )
-        ]
-        _write_json(tmp_path / "items.json", items)
-
+    def test_extracts_state_description_patterns(self) -> None:
         report = AnalysisReport()
-        parse_items_snapshot(tmp_path / "items.json", report)
+        parse_items(_ITEM_VARIANTS["state_pattern"], report)
         info = report.item_types["Number:Temperature"]
         assert info.has_pattern == 1
         assert "%.1f °C" in info.pattern_examples
+        assert info.unit_examples == ["°C"]
+
+    @pytest.mark.parametrize(
+        ("pattern", "units"),
+        [
+            pytest.param("%.1f °C", ["°C"], id="float-with-unit"),
+            pytest.param("%.2f kWh", ["kWh"], id="multi-char-unit"),
+            pytest.param("%d %%", ["%%"], id="percent"),
+            pytest.param("%.1f", [], id="float-without-unit"),
+            pytest.param("%d", [], id="int-without-unit"),
+        ],
+    )
+    def test_extracts_units_from_patterns(self, pattern: str, units: list[str]) -> None:
+        """Only text after the format specifier is reported as a unit."""
+        report = AnalysisReport()
+        parse_items([_make_item(stateDescription={"pattern": pattern})], report)
+        assert report.item_types["Number:Temperature"].unit_examples == units
 
-    def test_detects_encoding_issues(self, tmp_path: Path) -> None:
+    def test_detects_encoding_issues(self) -> None:
         """Mojibake markers (Â, â€) are flagged."""
-        items = [_make_item(state="21.5 Â°C")]
-        _write_json(tmp_path / "items.json", items)
-
         report = AnalysisReport()
-        parse_items_snapshot(tmp_path / "items.json", report)
+        parse_items(_ITEM_VARIANTS["mojibake"], report)
         assert len(report.encoding_issues) == 1
 
-    def test_stores_fixture_candidates_for_new_types(self, tmp_path: Path) -> None:
+    def test_stores_fixture_candidates_for_new_types(self) -> None:
         """Types absent from EXISTING_FIXTURE_TYPES become candidates."""
-        new_type = "SyntheticTestType"
-        items = [
-            _make_item(
-                item_type=new_type,
-                state="42",
-                name="Test_Device",
-            )
-        ]
-        _write_json(tmp_path / "items.json", items)
-
         report = AnalysisReport()
-        parse_items_snapshot(tmp_path / "items.json", report)
-        assert new_type in report.fixture_candidates
-
-    def test_tracks_transformed_state(self, tmp_path: Path) -> None:
-        items = [_make_item(transformed_state="21.5 °C")]
-        _write_json(tmp_path / "items.json", items)
+        parse_items(_ITEM_VARIANTS["new_type"], report)
+        assert _NEW_ITEM_TYPE in report.fixture_candidates
 
+    def test_tracks_transformed_state(self) -> None:
         report = AnalysisReport()
-        parse_items_snapshot(tmp_path / "items.json", report)
+        parse_items(_ITEM_VARIANTS["transformed_state"], report)
         info = report.item_types["Number:Temperature"]
         assert info.has_transformed_state == 1
 
 
 class TestParseSseEvents:
-    """Tests for parse_sse_events() — SSE event log parsing.
+    """Tests for parse_sse_content() and parse_sse_events() — SSE log parsing.
 
     Technique: Equivalence Partitioning — subscription batches vs topic events.
     """
 
-    def test_parses_topic_events(self, tmp_path: Path) -> None:
+    def test_parses_topic_events(self) -> None:
         """Traditional SSE events with 'topic' field."""
-        payload = json.dumps({"type": "Decimal", "value": "21.5"})
-        event = json.dumps(
-            {
-                "topic": "openhab/items/Temp/state",
-                "type": "ItemStateEvent",
-                "payload": payload,
-            }
-        )
-        sse_file = tmp_path / "events.log"
-        sse_file.write_text(f"data: {event}\n\n")
-
         report = AnalysisReport()
-        parse_sse_events(sse_file, report)
+        parse_sse_content(_TOPIC_EVENT_LOG, report)
         assert report.total_events == 1
         assert "ItemStateEvent" in report.sse_events
 
-    def test_parses_subscription_batches(self, tmp_path: Path) -> None:
+    def test_parses_subscription_batches(self) -> None:
         """Subscription batch: dict without 'topic' key."""
-        batch = json.dumps(
-            {
-                "Temp_Sensor": {"state": "21.5", "type": "Decimal"},
-                "Light_Switch": {"state": "ON", "type": "OnOff"},
-            }
-        )
-        sse_file = tmp_path / "events.log"
-        sse_file.write_text(f"data: {batch}\n\n")
-
         report = AnalysisReport()
-        parse_sse_events(sse_file, report)
+        parse_sse_content(_SUBSCRIPTION_BATCH_LOG, report)
         assert "StateSubscription" in report.sse_events
         assert report.sse_events["StateSubscription"].count == 2
 
-    def test_skips_malformed_blocks(self, tmp_path: Path) -> None:
+    def test_skips_malformed_blocks(self) -> None:
         """Blocks without 'data:' prefix are ignored."""
-        sse_file = tmp_path / "events.log"
-        sse_file.write_text("event: keepalive\n\n")
-
         report = AnalysisReport()
-        parse_sse_events(sse_file, report)
+        parse_sse_content("event: keepalive\n\n", report)
         assert report.total_events == 0
 
-    def test_skips_invalid_json(self, tmp_path: Path) -> None:
+    def test_skips_invalid_json(self) -> None:
         """Non-JSON data lines are silently skipped."""
-        sse_file = tmp_path / "events.log"
-        sse_file.write_text("data: not-json-content\n\n")
-
         report = AnalysisReport()
-        parse_sse_events(sse_file, report)
+        parse_sse_content("data: not-json-content\n\n", report)
         assert report.total_events == 0
 
-    def test_tracks_display_state_in_subscriptions(self, tmp_path: Path) -> None:
+    def test_tracks_display_state_in_subscriptions(self) -> None:
         """displayState presence is counted in subscription events."""
-        batch = json.dumps(
-            {
-                "Temp": {"state": "21.5", "type": "Decimal", "displayState": "21.5 °C"},
-            }
-        )
+        report = AnalysisReport()
+        parse_sse_content(_DISPLAY_STATE_LOG, report)
+        assert report.sse_events["StateSubscription"].has_display_state == 1
+
+    def test_events_reads_log_from_file(self, tmp_path: Path) -> None:
         sse_file = tmp_path / "events.log"
-        sse_file.write_text(f"data: {batch}\n\n")
+        sse_file.write_text(_SUBSCRIPTION_BATCH_LOG)
 
         report = AnalysisReport()
         parse_sse_events(sse_file, report)
-        assert report.sse_events["StateSubscription"].has_display_state == 1
+        assert report.total_events == 1
+        assert report.sse_events["StateSubscription"].count == 2
 
 
 class TestParseRootSnapshot:
@@ -404,45 +420,57 @@ class TestAnalyzeGaps:
     Technique: Equivalence Partitioning — known vs unknown item/event types.
     """
 
-    def test_flags_unknown_item_type(self) -> None:
-        unknown = "SyntheticTestType"
+    @pytest.mark.parametrize(
+        ("attribute", "key", "info", "expected"),
+        [
+            pytest.param(
+                "item_types",
+                "SyntheticTestType",
+                ItemTypeInfo(type_name="SyntheticTestType", count=1),
+                ["Item type: SyntheticTestType"],
+                id="unknown-item-type",
+            ),
+            pytest.param(
+                "sse_events",
+                "SyntheticTestEvent",
+                SSEEventInfo(event_type="SyntheticTestEvent", count=3),
+                ["SSE event: SyntheticTestEvent"],
+                id="unknown-sse-event",
+            ),
+            pytest.param(
+                "item_types",
+                "Switch",
+                ItemTypeInfo(type_name="Switch", count=2, has_transformed_state=1),
+                ["transformedState (Switch: 1 items)"],
+                id="transformed-state",
+            ),
+            pytest.param(
+                "item_types",
+                "String",
+                ItemTypeInfo(type_name="String", count=1, has_options=1),
+                ["stateDescription.options (String: 1 items)"],
+                id="options",
+            ),
+        ],
+    )
+    def test_flags_gap(
+        self,
+        attribute: str,
+        key: str,
+        info: ItemTypeInfo | SSEEventInfo,
+        expected: list[str],
+    ) -> None:
         report = AnalysisReport()
-        report.item_types[unknown] = ItemTypeInfo(type_name=unknown, count=1)
+        getattr(report, attribute)[key] = info
         analyze_gaps(report)
-        assert any(unknown in gap for gap in report.missing_from_fixtures)
+        assert report.missing_from_fixtures == expected
 
     def test_does_not_flag_known_item_type(self) -> None:
         known = next(iter(EXISTING_FIXTURE_TYPES))
         report = AnalysisReport()
         report.item_types[known] = ItemTypeInfo(type_name=known, count=5)
         analyze_gaps(report)
-        item_gaps = [
-            g for g in report.missing_from_fixtures if g.startswith("Item type")
-        ]
-        assert not any(known in g for g in item_gaps)
-
-    def test_flags_unknown_sse_event(self) -> None:
-        unknown = "SyntheticTestEvent"
-        report = AnalysisReport()
-        report.sse_events[unknown] = SSEEventInfo(event_type=unknown, count=3)
-        analyze_gaps(report)
-        assert any(unknown in gap for gap in report.missing_from_fixtures)
-
-    def test_flags_transformed_state_presence(self) -> None:
-        report = AnalysisReport()
-        report.item_types["Switch"] = ItemTypeInfo(
-            type_name="Switch", count=2, has_transformed_state=1
-        )
-        analyze_gaps(report)
-        assert any("transformedState" in gap for gap in report.missing_from_fixtures)
-
-    def test_flags_options_presence(self) -> None:
-        report = AnalysisReport()
-        report.item_types["String"] = ItemTypeInfo(
-            type_name="String", count=1, has_options=1
-        )
-        analyze_gaps(report)
-        assert any("options" in gap for gap in report.missing_from_fixtures)
+        assert report.missing_from_fixtures == []
 
 
 # =============================================================================
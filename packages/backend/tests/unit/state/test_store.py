@@ -299,6 +299,41 @@ class TestSetMany:
         assert result.value == "99.9"
 
 
+class TestVersion:
+    """Specification-based tests for SignalStore.version."""
+
+    def test_starts_at_zero(self, store: SignalStore) -> None:
+        """A new store reports version 0."""
+        assert store.version == 0
+
+    async def test_writes_increment_version(
+        self,
+        store: SignalStore,
+        sample_signal: Signal,
+        sample_signals: dict[str, Signal],
+    ) -> None:
+        """set() and set_many() each bump the version."""
+        await store.set(sample_signal)
+        after_set = store.version
+
+        await store.set_many(sample_signals)
+
+        assert after_set == 1
+        assert store.version == 2
+
+    async def test_reads_do_not_change_version(
+        self, store: SignalStore, sample_signal: Signal
+    ) -> None:
+        """get() and get_all() leave the version unchanged."""
+        await store.set(sample_signal)
+        before = store.version
+
+        await store.get(sample_signal.id)
+        await store.get_all()
+
+        assert store.version == before
+
+
 @pytest.mark.usefixtures("mock_settings")
 class TestSubscribe:
     """State transition tests for pub/sub subscriber lifecycle.
@@ -619,6 +654,7 @@ class TestQueueOverflow:
         started = asyncio.Event()
         first_batch_done = asyncio.Event()
         can_resume = asyncio.Event()
+        queue_drained = asyncio.Event()
 
         async def subscriber():
             gen = store.subscribe()
@@ -631,6 +667,9 @@ class TestQueueOverflow:
                         # After first message, pause to let queue fill
                         first_batch_done.set()
                         await can_resume.wait()
+                    if count == 3:
+                        # sig_1 and sig_2 consumed (sig_3 was dropped)
+                        queue_drained.set()
                     if count >= 4:
                         break
             finally:
@@ -654,17 +693,8 @@ class TestQueueOverflow:
         # Let subscriber drain queue, which makes room for more
         can_resume.set()
 
-        # Wait for subscriber to start processing (verify it's still active)
-        await wait_for_condition(
-            lambda: store.get_metrics()["subscribers"]["total"] > 0,
-            timeout=0.5,
-            description="subscriber still active",
-        )
-        # Yield to event loop so subscriber can process queued items.
-        # Note: This is a coordination yield, not a state verification wait.
-        # We can't observe queue space directly; the subsequent publish + assert
-        # verifies the intended behavior (slow status cleared on success).
-        await asyncio.sleep(0.01)
+        # Wait until the subscriber has emptied its queue
+        await asyncio.wait_for(queue_drained.wait(), timeout=1.0)
 
         # Now publish another - this should succeed and clear drop_stats
         await store.publish(Signal(id="sig_4", value="4", unit="", label=""))